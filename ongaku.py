@@ -2,6 +2,7 @@
 import curses
 import threading
 import json
+import atexit
 import yt_dlp
 import vlc
 import os
@@ -11,10 +12,144 @@ import signal
 import sys
 import struct
 import math
+import unicodedata
+import select
+import functools
+import heapq
+import queue
+import itertools
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import orjson  # Optional - much faster than the stdlib json module
+except ImportError:
+    orjson = None
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj, indent=False) -> bytes:
+    """Serialize an object to JSON bytes with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def _write_bytes_atomic(path: Path, data: bytes):
+    """Write a file in one buffered write via a temp file, so a crash never leaves it truncated"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+@functools.lru_cache(maxsize=8192)
+def _fmt_time(sec: int) -> str:
+    """Format whole seconds as M:SS (memoized - the same few values are formatted every frame)"""
+    minutes, seconds = divmod(sec, 60)
+    return f"{minutes}:{seconds:02d}"
+
+def _clip_to_columns(text: str, columns: int) -> str:
+    """Cut text to at most the given number of terminal columns (wide CJK/emoji characters take two)"""
+    used = 0
+    for i, ch in enumerate(text):
+        used += 2 if unicodedata.east_asian_width(ch) in ('W', 'F') else 1
+        if used > columns:
+            return text[:i]
+    return text
+
+class _DaemonWorker:
+    """Runs submitted calls on daemon threads, so pending work never holds up exit"""
+    
+    def __init__(self, workers=1, name="ongaku-worker"):
+        self._queue = queue.Queue()
+        for i in range(workers):
+            threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True).start()
+    
+    def submit(self, fn, *args) -> Future:
+        """Queue fn(*args); the future can still be cancelled until a worker picks it up"""
+        future = Future()
+        self._queue.put((future, fn, args))
+        return future
+    
+    def _run(self):
+        while True:
+            future, fn, args = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue  # Cancelled while queued
+            try:
+                result = fn(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+class _StreamURLCache:
+    """Size- and age-bounded cache of extracted stream URLs, keyed by video ID"""
+    MAX_ENTRIES = 128
+    TTL = 5 * 3600  # Signed YouTube stream URLs stay valid for about 6 hours
+    
+    def __init__(self, max_entries=MAX_ENTRIES, ttl=TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # video_id -> (stream_url, inserted_at)
+        self._lock = threading.Lock()  # Shared by playback and prefetch threads
+    
+    def get(self, video_id: str) -> Optional[str]:
+        """Return a cached stream URL, evicting it if it has expired"""
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None:
+                return None
+            stream_url, inserted_at = entry
+            if time.time() - inserted_at >= self.ttl:
+                del self._entries[video_id]
+                return None
+            self._entries.move_to_end(video_id)
+            return stream_url
+    
+    def put(self, video_id: str, stream_url: str):
+        """Cache a stream URL, dropping the least recently used entry when full"""
+        with self._lock:
+            self._entries[video_id] = (stream_url, time.time())
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def discard(self, video_id: str):
+        """Drop a cached stream URL if present"""
+        with self._lock:
+            self._entries.pop(video_id, None)
+    
+    def __contains__(self, video_id):
+        return self.get(video_id) is not None
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def to_dict(self) -> Dict:
+        """Export entries as {video_id: {'url': ..., 'ts': ...}} for persistence"""
+        with self._lock:
+            return {video_id: {'url': stream_url, 'ts': inserted_at}
+                    for video_id, (stream_url, inserted_at) in self._entries.items()}
+    
+    def load_dict(self, data: Dict):
+        """Import entries exported by to_dict, skipping ones that have expired"""
+        now = time.time()
+        entries = sorted(data.items(), key=lambda item: item[1].get('ts', 0))
+        with self._lock:
+            for video_id, entry in entries[-self.max_entries:]:
+                inserted_at = entry.get('ts', 0)
+                if entry.get('url') and now - inserted_at < self.ttl:
+                    self._entries[video_id] = (entry['url'], inserted_at)
 
 class MusicPlayer:
+    SAVE_DEBOUNCE = 0.5  # Seconds to coalesce bursts of favorite/playlist edits into one write
+    
     def __init__(self):
         self.search_results = []
         
@@ -44,122 +179,227 @@ class MusicPlayer:
             print(f"On macOS: brew install vlc")
             import sys
             sys.exit(1)
+        # Set by libvlc once the player has actually stopped
+        self._stopped = threading.Event()
+        self.player.event_manager().event_attach(vlc.EventType.MediaPlayerStopped, self._on_vlc_stopped)
         self.is_playing = False
         self.current_track = None
         self.current_duration = 0  # Track duration in seconds
-        self.stream_cache = {}  # Cache extracted stream URLs
+        self.stream_cache = _StreamURLCache()  # Cache extracted stream URLs
         self.current_query = ""  # Store current search query for pagination
         self.total_fetched = 0  # Track how many results we've fetched
         self.volume = 100  # Default volume (0-100)
         self.favorites = []  # List of favorite tracks
+        self.favorite_ids = set()  # IDs of favorite tracks; read directly by the UI for O(1) star lookups
         self.favorites_file = Path.home() / "ongaku" / "favorites.json"
         self.playlists = []  # List of playlists
-        self.playlists_file = Path.home() / "ongaku" / "playlists.json"
+        self._playlist_by_id = {}  # Playlist ID -> playlist dict (same objects as self.playlists)
+        self._playlist_durations = {}  # Playlist ID -> total track duration, kept in step with edits
+        self.playlists_dir = Path.home() / "ongaku" / "playlists"  # One <id>.json per playlist
+        self.playlists_file = Path.home() / "ongaku" / "playlists.json"  # Legacy single-file format
+        self.stream_cache_file = Path.home() / "ongaku" / "stream_cache.json"
         self.current_playlist = None  # Currently playing playlist
         self.current_playlist_index = -1  # Current track index in playlist
         self.visualizer = None  # Reference to visualizer for immediate clearing
+        self.on_library_changed = None  # Called after favorites/playlists are added or removed
+        self.library_version = 0  # Bumped on every change to favorites or playlists
+        self._prefetching = set()  # Video IDs with a stream URL prefetch in flight
+        self._prefetch_window = 3  # Playlist tracks ahead of the current one to keep extracted
+        self._prefetch_lock = threading.Lock()
+        
+        # Long-lived yt-dlp instances - constructing YoutubeDL loads every extractor,
+        # so we build them once instead of on every search/extraction
+        self._ydl_search = yt_dlp.YoutubeDL({
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': 'in_playlist',  # Search entries stay flat; nothing is resolved per video
+            'force_generic_extractor': False,
+            'skip_download': True,
+            'writethumbnail': False,
+        })
+        self._ydl_stream = yt_dlp.YoutubeDL({
+            # Prefer a plain progressive HTTPS URL that VLC can open without a manifest
+            'format': 'bestaudio[protocol^=http]/bestaudio/best',
+            # The ios/android clients return pre-signed URLs, skipping the JS
+            # signature decryption of the web player; DASH manifests are never used
+            'extractor_args': {'youtube': {'player_client': ['ios', 'android'], 'skip': ['dash']}},
+            'quiet': True,
+            'no_warnings': True,
+            'logger': None,  # Disable logging
+            'no_color': True,
+            'nocheckcertificate': True,  # Help with SSL issues
+            'ignoreerrors': True,  # Continue on errors
+            'skip_download': True,
+        })
+        atexit.register(self._ydl_search.close)
+        atexit.register(self._ydl_stream.close)
+        # Playback, prefetch and auto-advance all extract on the shared stream YoutubeDL
+        self._stream_lock = threading.Lock()
+        
+        # Searches run here so the UI thread never waits on yt-dlp
+        # One worker, so searches and load-mores run in the order they were asked for
+        self._executor = _DaemonWorker(name="ongaku-search")
+        self._search_lock = threading.Lock()  # One search at a time on the shared YoutubeDL
+        self._search_generation = 0  # Bumped per search; a load-more from an older one is dropped
+        # Prefetches run one at a time, nearest track first
+        self._prefetch_worker = _DaemonWorker(name="ongaku-prefetch")
+        
         self.load_favorites()
         self.load_playlists()
-        
+        self.load_stream_cache()
+        atexit.register(self.save_stream_cache)
+        
+        # Favorites/playlists are written by a background thread so edits never block the UI
+        self._pending_saves = set()  # Names of collections waiting to be written
+        self._pending_playlists = set()  # IDs of playlists waiting to be written or deleted
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()  # Serializes the worker and the exit flush
+        self._save_event = threading.Event()
+        threading.Thread(target=self._save_worker, daemon=True).start()
+        atexit.register(self.flush_saves)
+        
+    def search_youtube_async(self, query: str, limit: int = 10) -> Future:
+        """Start a search in the background; the future resolves to the result list"""
+        self._search_generation += 1
+        return self._executor.submit(self.search_youtube, query, limit)
+    
+    def fetch_more_results_async(self, count: int = 10) -> Future:
+        """Fetch more results in the background; the future resolves to the new results"""
+        return self._executor.submit(self.fetch_more_results, count, self._search_generation)
+    
     def search_youtube(self, query: str, limit: int = 10) -> List[Dict]:
         """Search YouTube using yt-dlp and return results"""
+        with self._search_lock:
+            return self._search_youtube(query, limit)
+    
+    def _search_youtube(self, query: str, limit: int) -> List[Dict]:
+        """search_youtube body; caller holds _search_lock"""
         self.current_query = query
         self.total_fetched = 0
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True,
-            'force_generic_extractor': False,
-        }
         
         results = []
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                search_results = ydl.extract_info(f"ytsearch{limit}:{query}", download=False)
-                
-                for entry in search_results.get('entries', []):
-                    results.append({
-                        'title': entry.get('title', 'Unknown'),
-                        'url': f"https://youtube.com/watch?v={entry.get('id', '')}",
-                        'duration': entry.get('duration', 0),
-                        'uploader': entry.get('uploader', 'Unknown'),
-                        'id': entry.get('id', '')
-                    })
-                self.total_fetched = len(results)
+            search_results = self._ydl_search.extract_info(f"ytsearch{limit}:{query}", download=False)
+            
+            results = [self._result_from_entry(entry) for entry in search_results.get('entries', []) if entry]
+            self.total_fetched = len(results)
         except Exception as e:
             pass
             
         return results
     
-    def fetch_more_results(self, count: int = 10) -> List[Dict]:
-        """Fetch more results for the current query"""
+    def fetch_more_results(self, count: int = 10, generation: Optional[int] = None) -> List[Dict]:
+        """Fetch more results for the current query, or none if a newer search started since generation"""
+        with self._search_lock:
+            if generation is not None and generation != self._search_generation:
+                return []  # total_fetched belongs to the newer query now
+            return self._fetch_more_results(count)
+    
+    def _fetch_more_results(self, count: int) -> List[Dict]:
+        """fetch_more_results body; caller holds _search_lock"""
         if not self.current_query:
             return []
-            
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True,
-            'force_generic_extractor': False,
-        }
         
         new_results = []
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # YouTube search actually fetches more results than requested
-                # We fetch a larger batch and slice what we need
-                total_to_fetch = self.total_fetched + count + 10
-                search_results = ydl.extract_info(f"ytsearch{total_to_fetch}:{self.current_query}", download=False)
-                
-                entries = search_results.get('entries', [])
-                # Get only the new results we haven't seen yet
-                for entry in entries[self.total_fetched:self.total_fetched + count]:
-                    if entry:  # Make sure entry exists
-                        new_results.append({
-                            'title': entry.get('title', 'Unknown'),
-                            'url': f"https://youtube.com/watch?v={entry.get('id', '')}",
-                            'duration': entry.get('duration', 0),
-                            'uploader': entry.get('uploader', 'Unknown'),
-                            'id': entry.get('id', '')
-                        })
-                
-                self.total_fetched += len(new_results)
+            # YouTube search actually fetches more results than requested
+            # We fetch a larger batch and slice what we need
+            total_to_fetch = self.total_fetched + count + 10
+            search_results = self._ydl_search.extract_info(f"ytsearch{total_to_fetch}:{self.current_query}", download=False)
+            
+            entries = search_results.get('entries', [])
+            # Get only the new results we haven't seen yet
+            new_results = [self._result_from_entry(entry)
+                           for entry in entries[self.total_fetched:self.total_fetched + count] if entry]
+            
+            self.total_fetched += len(new_results)
         except Exception as e:
             pass
             
         return new_results
     
+    @staticmethod
+    def _result_from_entry(entry: Dict) -> Dict:
+        """Keep only the fields we use from a flat yt-dlp search entry"""
+        get = entry.get
+        video_id = get('id', '')
+        return {
+            'title': get('title', 'Unknown'),
+            'url': f"https://youtube.com/watch?v={video_id}",
+            'duration': get('duration', 0),
+            'uploader': get('uploader', 'Unknown'),
+            'id': video_id
+        }
+    
+    @staticmethod
+    def video_id_from_url(url: str) -> str:
+        """Get the video ID part of a YouTube URL"""
+        return url.split('watch?v=')[-1] if 'watch?v=' in url else url.split('/')[-1]
+    
     def extract_stream_url(self, url: str) -> Optional[str]:
         """Extract direct stream URL from YouTube URL"""
-        video_id = url.split('watch?v=')[-1] if 'watch?v=' in url else url.split('/')[-1]
+        video_id = self.video_id_from_url(url)
         
         # Check cache first
-        if video_id in self.stream_cache:
-            return self.stream_cache[video_id]
-        
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'quiet': True,
-            'no_warnings': True,
-            'logger': None,  # Disable logging
-            'no_color': True,
-            'nocheckcertificate': True,  # Help with SSL issues
-            'ignoreerrors': True,  # Continue on errors
-        }
+        stream_url = self.stream_cache.get(video_id)
+        if stream_url:
+            return stream_url
         
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                stream_url = info.get('url') if info else None
-                
-                # Cache the stream URL
-                if stream_url:
-                    self.stream_cache[video_id] = stream_url
-                
-                return stream_url
+            with self._stream_lock:
+                info = self._ydl_stream.extract_info(url, download=False)
+            stream_url = info.get('url') if info else None
+            
+            # Cache the stream URL
+            if stream_url:
+                self.stream_cache.put(video_id, stream_url)
+            
+            return stream_url
         except Exception:
             return None
     
+    def _prefetch_around_current(self):
+        """Keep stream URLs for the next few playlist tracks cached and drop the ones left behind"""
+        if not self.current_playlist:
+            return
+        
+        tracks = self.current_playlist.get('tracks', [])
+        count = len(tracks)
+        if count < 2:
+            return
+        
+        index = self.current_playlist_index
+        window = min(self._prefetch_window, count - 1)
+        ahead = [tracks[(index + offset) % count] for offset in range(1, window + 1)]
+        
+        # Forget the track that just fell out of the window behind us, unless
+        # a short playlist wraps it back into range
+        keep = {self.video_id_from_url(tracks[(index + offset) % count]['url'])
+                for offset in range(-window, window + 1)}
+        behind_id = self.video_id_from_url(tracks[(index - window - 1) % count]['url'])
+        if behind_id not in keep:
+            self.stream_cache.discard(behind_id)
+        
+        for track in ahead:
+            video_id = self.video_id_from_url(track['url'])
+            with self._prefetch_lock:
+                if video_id in self.stream_cache or video_id in self._prefetching:
+                    continue
+                self._prefetching.add(video_id)
+            self._prefetch_worker.submit(self._prefetch, track['url'], video_id)
+    
+    def _prefetch(self, url: str, video_id: str):
+        """Extract one stream URL into the cache (runs on the prefetch worker)"""
+        try:
+            self.extract_stream_url(url)
+        finally:
+            with self._prefetch_lock:
+                self._prefetching.discard(video_id)
+    
+    def _on_vlc_stopped(self, event):
+        """libvlc MediaPlayerStopped callback (runs on a libvlc thread)"""
+        self._stopped.set()
+    
     def play_track(self, url: str, title: str, duration: int = 0, from_playlist=False):
         """Play a track using VLC"""
         self.stop(clear_playlist=not from_playlist)  # Stop current playback, preserve playlist context if needed
@@ -236,66 +476,166 @@ class MusicPlayer:
             progress = 0
         return current_time, self.current_duration, progress
     
+    def load_stream_cache(self):
+        """Load still-valid stream URLs saved by a previous session"""
+        try:
+            if self.stream_cache_file.exists():
+                self.stream_cache.load_dict(_json_loads(self.stream_cache_file.read_bytes()))
+        except Exception:
+            pass
+    
+    def save_stream_cache(self):
+        """Save cached stream URLs so replays after a restart skip extraction"""
+        try:
+            _write_bytes_atomic(self.stream_cache_file, _json_dumps(self.stream_cache.to_dict()))
+        except Exception:
+            pass
+    
     def load_favorites(self):
         """Load favorites from JSON file"""
         try:
             if self.favorites_file.exists():
-                with open(self.favorites_file, 'r') as f:
-                    self.favorites = json.load(f)
+                self.favorites = _json_loads(self.favorites_file.read_bytes())
         except Exception:
             self.favorites = []
+        self.favorite_ids = {fav['id'] for fav in self.favorites if fav.get('id')}
     
     def save_favorites(self):
+        """Schedule favorites to be saved to JSON file"""
+        self._schedule_save('favorites')
+    
+    def _write_favorites(self):
         """Save favorites to JSON file"""
         try:
-            # Create directory if it doesn't exist
-            self.favorites_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.favorites_file, 'w') as f:
-                json.dump(self.favorites, f, indent=2)
+            _write_bytes_atomic(self.favorites_file, _json_dumps(self.favorites, indent=True))
         except Exception:
             pass
     
     def add_to_favorites(self, track: Dict):
         """Add a track to favorites"""
         # Check if track is already in favorites (by ID)
-        if not any(fav.get('id') == track.get('id') for fav in self.favorites):
-            self.favorites.append(track)
-            self.save_favorites()
-            return True
-        return False
+        track_id = track.get('id')
+        if track_id in self.favorite_ids:
+            return False
+        self.favorites.append(track)
+        if track_id:
+            self.favorite_ids.add(track_id)
+        self.save_favorites()
+        self._notify_library_changed()
+        return True
     
     def remove_from_favorites(self, track_id: str):
         """Remove a track from favorites by ID"""
-        original_len = len(self.favorites)
+        if track_id not in self.favorite_ids:
+            return False
         self.favorites = [fav for fav in self.favorites if fav.get('id') != track_id]
-        if len(self.favorites) < original_len:
-            self.save_favorites()
-            return True
-        return False
+        self.favorite_ids.discard(track_id)
+        self.save_favorites()
+        self._notify_library_changed()
+        return True
+    
+    def _notify_library_changed(self):
+        """Tell the UI that the number of favorites/playlists changed"""
+        self.library_version += 1
+        if self.on_library_changed:
+            self.on_library_changed()
     
     def is_favorite(self, track_id: str) -> bool:
         """Check if a track is in favorites"""
-        return any(fav.get('id') == track_id for fav in self.favorites)
+        return track_id in self.favorite_ids
     
     def load_playlists(self):
-        """Load playlists from JSON file"""
+        """Load playlists from their JSON files"""
         try:
             if self.playlists_file.exists():
-                with open(self.playlists_file, 'r') as f:
-                    self.playlists = json.load(f)
+                self._migrate_playlists_file()
+            paths = list(self.playlists_dir.glob('*.json'))
+            # Overlap file reads and parsing across playlists
+            with ThreadPoolExecutor() as pool:
+                loaded = list(pool.map(self._read_playlist_file, paths))
+            self.playlists = sorted((p for p in loaded if p), key=lambda p: p.get('created', 0))
         except Exception:
             self.playlists = []
+        self._reindex_playlists()
     
-    def save_playlists(self):
-        """Save playlists to JSON file"""
+    @staticmethod
+    def _read_playlist_file(path: Path) -> Optional[Dict]:
+        """Parse one playlist file, or None if it is unreadable"""
         try:
-            # Create directory if it doesn't exist
-            self.playlists_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.playlists_file, 'w') as f:
-                json.dump(self.playlists, f, indent=2)
+            return _json_loads(path.read_bytes())
+        except Exception:
+            return None
+    
+    def _migrate_playlists_file(self):
+        """Split the legacy playlists.json into one file per playlist"""
+        for playlist in _json_loads(self.playlists_file.read_bytes()):
+            self._write_playlist_file(playlist)
+        self.playlists_file.replace(self.playlists_file.with_name(self.playlists_file.name + ".bak"))
+    
+    def _reindex_playlists(self):
+        """Rebuild the playlist ID -> playlist map and the duration totals"""
+        self._playlist_by_id = {p.get('id'): p for p in self.playlists}
+        self._playlist_durations = {p.get('id'): self._total_duration(p.get('tracks', [])) for p in self.playlists}
+    
+    @staticmethod
+    def _total_duration(tracks: List[Dict]) -> int:
+        """Sum the durations of a list of tracks"""
+        return sum(track.get('duration', 0) or 0 for track in tracks)
+    
+    def get_playlist(self, playlist_id: str) -> Optional[Dict]:
+        """Look up a playlist by ID"""
+        return self._playlist_by_id.get(playlist_id)
+    
+    def playlist_duration(self, playlist_id: str) -> int:
+        """Total duration of a playlist's tracks, without re-summing them"""
+        return self._playlist_durations.get(playlist_id, 0)
+    
+    def save_playlist(self, playlist_id: str):
+        """Schedule a playlist to be saved to (or, once deleted, removed from) disk"""
+        with self._pending_lock:
+            self._pending_playlists.add(playlist_id)
+        self._save_event.set()
+    
+    def _write_playlist_file(self, playlist: Dict):
+        """Save one playlist to its JSON file"""
+        _write_bytes_atomic(self.playlists_dir / f"{playlist['id']}.json", _json_dumps(playlist, indent=True))
+    
+    def _write_playlist(self, playlist_id: str):
+        """Write a playlist's file, or remove it if the playlist no longer exists"""
+        try:
+            playlist = self._playlist_by_id.get(playlist_id)
+            if playlist is not None:
+                self._write_playlist_file(playlist)
+            else:
+                (self.playlists_dir / f"{playlist_id}.json").unlink()
         except Exception:
             pass
     
+    def _schedule_save(self, name: str):
+        """Queue a collection for the background save thread"""
+        with self._pending_lock:
+            self._pending_saves.add(name)
+        self._save_event.set()
+    
+    def _save_worker(self):
+        """Background thread that writes queued collections, at most once per debounce period"""
+        while True:
+            self._save_event.wait()
+            time.sleep(self.SAVE_DEBOUNCE)  # Let a burst of edits settle first
+            self._save_event.clear()
+            self.flush_saves()
+    
+    def flush_saves(self):
+        """Write all queued collections now"""
+        with self._write_lock:
+            with self._pending_lock:
+                pending, self._pending_saves = self._pending_saves, set()
+                playlist_ids, self._pending_playlists = self._pending_playlists, set()
+            if 'favorites' in pending:
+                self._write_favorites()
+            for playlist_id in playlist_ids:
+                self._write_playlist(playlist_id)
+    
     def create_playlist(self, name: str, tracks: List[Dict]) -> bool:
         """Create a new playlist"""
         if not name or not tracks:
@@ -307,8 +647,11 @@ class MusicPlayer:
             'tracks': tracks,
             'created': time.time()
         }
+        self._playlist_by_id[playlist['id']] = playlist
+        self._playlist_durations[playlist['id']] = self._total_duration(tracks)
         self.playlists.append(playlist)
-        self.save_playlists()
+        self.save_playlist(playlist['id'])
+        self._notify_library_changed()
         return True
     
     def update_playlist(self, playlist_id: str, name: str, tracks: List[Dict]) -> bool:
@@ -316,33 +659,40 @@ class MusicPlayer:
         if not name or not tracks:
             return False
         
-        for i, playlist in enumerate(self.playlists):
-            if playlist.get('id') == playlist_id:
-                self.playlists[i]['name'] = name
-                self.playlists[i]['tracks'] = tracks
-                self.save_playlists()
-                return True
-        return False
+        playlist = self._playlist_by_id.get(playlist_id)
+        if playlist is None:
+            return False
+        playlist['name'] = name
+        playlist['tracks'] = tracks
+        self._playlist_durations[playlist_id] = self._total_duration(tracks)
+        self.library_version += 1
+        self.save_playlist(playlist_id)
+        return True
     
     def delete_playlist(self, playlist_id: str) -> bool:
         """Delete a playlist by ID"""
-        original_len = len(self.playlists)
-        self.playlists = [p for p in self.playlists if p.get('id') != playlist_id]
-        if len(self.playlists) < original_len:
-            self.save_playlists()
-            return True
-        return False
+        playlist = self._playlist_by_id.pop(playlist_id, None)
+        if playlist is None:
+            return False
+        self._playlist_durations.pop(playlist_id, None)
+        self.playlists.remove(playlist)
+        self.save_playlist(playlist_id)
+        self._notify_library_changed()
+        return True
     
     def play_playlist_track(self, playlist_id: str, track_index: int):
         """Play a specific track from a playlist"""
-        playlist = next((p for p in self.playlists if p.get('id') == playlist_id), None)
+        playlist = self._playlist_by_id.get(playlist_id)
         if not playlist or track_index >= len(playlist.get('tracks', [])):
             return False
         
         self.current_playlist = playlist
         self.current_playlist_index = track_index
         track = playlist['tracks'][track_index]
-        return self.play_track(track['url'], track['title'], track.get('duration', 0), from_playlist=True)
+        success = self.play_track(track['url'], track['title'], track.get('duration', 0), from_playlist=True)
+        if success:
+            self._prefetch_around_current()
+        return success
     
     def play_next_in_playlist(self):
         """Play the next track in the current playlist"""
@@ -359,15 +709,17 @@ class MusicPlayer:
         
         # Force stop current track first
         if self.player:
+            self._stopped.clear()
             self.player.stop()
-        
-        # Add a small delay to ensure clean transition
-        import time
-        time.sleep(0.2)
+            # libvlc normally stops synchronously; only wait if it hasn't caught up yet
+            if self.player.get_state() not in (vlc.State.Stopped, vlc.State.NothingSpecial):
+                self._stopped.wait(0.2)
         
         # Try to play next track with error handling
         try:
             success = self.play_track(track['url'], track['title'], track.get('duration', 0), from_playlist=True)
+            if success:
+                self._prefetch_around_current()
             return success
         except Exception:
             # If this track fails, try the next one
@@ -393,114 +745,164 @@ class MusicPlayer:
             self.is_playing = False
             self.play_next_in_playlist()
 
+def _update_bands(bands, bar_params, base_amplitude, time_factor, sin=math.sin, cos=math.cos):
+    """Advance the visualizer's band levels by one frame, in place
+    
+    Pure numeric kernel kept free of object and VLC access, so the hot loop
+    only touches locals.
+    """
+    # The boost term is shared by every bar in a band - compute it once per frame
+    band_boosts = (
+        sin(time_factor * 0.8) * 0.3,  # Bass boost
+        cos(time_factor * 1.1) * 0.2,  # Mid boost
+        sin(time_factor * 3.0) * 0.2,  # Treble spike
+    )
+    
+    for i, (base_level, speed, phase, depth, band) in enumerate(bar_params):
+        variation = sin(time_factor * speed + phase) * depth
+        
+        # Scale by actual volume and clamp to 0..1 without min()/max() calls
+        target = (base_level + variation + band_boosts[band]) * base_amplitude
+        if target < 0.0:
+            target = 0.0
+        elif target > 1.0:
+            target = 1.0
+        
+        # Smooth transitions for realistic audio feel
+        level = bands[i]
+        smoothing = 0.6 if target > level else 0.2  # Quick attack, slower decay
+        bands[i] = smoothing * target + (1 - smoothing) * level
+
 class AudioVisualizer:
+    VLC_POLL_INTERVAL = 0.25  # Seconds between libvlc state queries
+    
     def __init__(self, bars=15):
         self.bars = bars
         self.frequency_bands = [0.0] * bars
         self.current_track = None  # Track the current song to detect changes
         self.needs_redraw = False  # Flag to force immediate redraw
+        self._cached_vlc = None  # (state, volume, time_ms, media_id) from the last libvlc query
+        self._last_vlc_poll = 0.0  # time.monotonic() of the last libvlc query
+        self.is_fading = False  # Some bar is still above zero, so further frames will change
+        
+        # Per-bar parameters never change, so work them out once instead of every frame:
+        # (base level, oscillation speed, phase offset, oscillation depth, band)
+        self._bar_params = []
+        for i in range(bars):
+            freq_ratio = i / (bars - 1)
+            
+            # Different frequency bands behave differently
+            if freq_ratio < 0.3:  # Bass range
+                self._bar_params.append((0.7, 1.2, i * 0.5, 0.4, 0))
+            elif freq_ratio < 0.7:  # Mid range
+                self._bar_params.append((0.5, 1.8, i * 0.3, 0.3, 1))
+            else:  # Treble range
+                self._bar_params.append((0.4, 2.5, i * 0.8, 0.4, 2))
         
     def update_from_vlc(self, player):
         """Sophisticated audio analysis using VLC data"""
         if not player or not player.is_playing:
             # Clear all bars immediately when not playing
-            for i in range(len(self.frequency_bands)):
-                self.frequency_bands[i] = 0.0
+            self._clear_bands()
             self.current_track = None
+            self._cached_vlc = None
             return
+        
+        # Every libvlc query is a ctypes round trip, so only poll a few times a second
+        # and reuse the last answer in between
+        now = time.monotonic()
+        if self._cached_vlc is None or now - self._last_vlc_poll >= self.VLC_POLL_INTERVAL:
+            try:
+                vlc_state = player.get_state()
+            except:
+                # If we can't get state, clear immediately
+                self._clear_bands()
+                self._cached_vlc = None
+                return
+            
+            volume = time_ms = 0
+            media_id = self.current_track
+            if vlc_state == vlc.State.Playing:
+                # Get VLC playback data
+                volume = player.audio_get_volume()
+                time_ms = player.get_time()
+                try:
+                    current_media = player.get_media()
+                    media_id = str(current_media) if current_media else None
+                except:
+                    pass
             
+            self._cached_vlc = (vlc_state, volume, time_ms, media_id)
+            self._last_vlc_poll = now
+        else:
+            vlc_state, volume, time_ms, media_id = self._cached_vlc
+            if time_ms > 0:
+                # Playback position moves on between polls - extrapolate it
+                time_ms += int((now - self._last_vlc_poll) * 1000)
+        
         # Check if actually playing (not paused)
-        try:
-            vlc_state = player.get_state()
-            if vlc_state == vlc.State.Paused:
-                # Paused - fade out slowly
-                for i in range(len(self.frequency_bands)):
-                    self.frequency_bands[i] *= 0.92  # Slow fade
-                return
-            elif vlc_state != vlc.State.Playing:
-                # Stopped or other non-playing state - clear immediately
-                for i in range(len(self.frequency_bands)):
-                    self.frequency_bands[i] = 0.0
-                return
-        except:
-            # If we can't get state, clear immediately
+        if vlc_state == vlc.State.Paused:
+            # Paused - fade out slowly
             for i in range(len(self.frequency_bands)):
-                self.frequency_bands[i] = 0.0
+                self.frequency_bands[i] *= 0.92  # Slow fade
+            self.is_fading = max(self.frequency_bands) > 0.01
+            return
+        elif vlc_state != vlc.State.Playing:
+            # Stopped or other non-playing state - clear immediately
+            self._clear_bands()
             return
-            
-        # Get VLC playback data
-        volume = player.audio_get_volume()
-        time_ms = player.get_time()
         
         if volume < 0 or time_ms <= 0:
             return
         
         # Check if track changed - clear visualizer immediately like progress bar
-        try:
-            current_media = player.get_media()
-            media_id = str(current_media) if current_media else None
-            if self.current_track != media_id:
-                # Track changed - clear bars immediately
-                for i in range(len(self.frequency_bands)):
-                    self.frequency_bands[i] = 0.0
-                self.current_track = media_id
-                return  # Skip this update to show immediate clearing
-        except:
-            pass
+        if self.current_track != media_id:
+            # Track changed - clear bars immediately
+            self._clear_bands()
+            self.current_track = media_id
+            return  # Skip this update to show immediate clearing
         
         # Sophisticated frequency analysis based on real playback data
-        base_amplitude = volume / 100.0
-        time_factor = (time_ms / 1000.0) * 2.0
-        
-        for i in range(self.bars):
-            freq_ratio = i / (self.bars - 1)
-            
-            # Different frequency bands behave differently
-            if freq_ratio < 0.3:  # Bass range
-                base_level = 0.7
-                variation = math.sin(time_factor * 1.2 + i * 0.5) * 0.4
-                bass_boost = math.sin(time_factor * 0.8) * 0.3
-                target = base_level + variation + bass_boost
-            elif freq_ratio < 0.7:  # Mid range  
-                base_level = 0.5
-                variation = math.sin(time_factor * 1.8 + i * 0.3) * 0.3
-                mid_boost = math.cos(time_factor * 1.1) * 0.2
-                target = base_level + variation + mid_boost
-            else:  # Treble range
-                base_level = 0.4
-                variation = math.sin(time_factor * 2.5 + i * 0.8) * 0.4
-                treble_spike = math.sin(time_factor * 3.0) * 0.2
-                target = base_level + variation + treble_spike
-            
-            # Scale by actual volume
-            target *= base_amplitude
-            target = max(0.0, min(1.0, target))
-            
-            # Smooth transitions for realistic audio feel
-            if target > self.frequency_bands[i]:
-                smoothing = 0.6  # Quick attack
-            else:
-                smoothing = 0.2  # Slower decay
-                
-            self.frequency_bands[i] = (smoothing * target + 
-                                     (1 - smoothing) * self.frequency_bands[i])
+        _update_bands(self.frequency_bands, self._bar_params, volume / 100.0, (time_ms / 1000.0) * 2.0)
+        self.is_fading = True
+    
+    def _clear_bands(self):
+        """Drop every bar to zero"""
+        bands = self.frequency_bands
+        for i in range(len(bands)):
+            bands[i] = 0.0
+        self.is_fading = False
     
     def get_bars(self, max_height=6):
         """Get visualizer bars scaled to max_height"""
-        bars = []
-        for level in self.frequency_bands:
-            bar_height = int(level * max_height)
-            bars.append(min(bar_height, max_height))
-        return bars
+        return [min(int(level * max_height), max_height) for level in self.frequency_bands]
     
     def clear_immediately(self):
         """Clear all visualizer bars immediately - for track changes"""
-        for i in range(len(self.frequency_bands)):
-            self.frequency_bands[i] = 0.0
+        self._clear_bands()
         self.current_track = None
+        self._cached_vlc = None  # Re-query libvlc for the new track
         self.needs_redraw = True  # Flag to force immediate redraw
 
 class MusicPlayerUI:
+    SELECTED_MARKER = "▶ "  # Prefix for the highlighted row
+    ROW_PADDING = "  "  # Same width as the marker, for unselected rows
+    NO_DURATION = "[--:--]"
+    HEADER_HOME = "Home"
+    HEADER_RESULTS = "Search Results"
+    STATUS_FAVORITES = "★ Favorites"
+    STATUS_NO_FAVORITES = "No favorites yet"
+    CHECKBOX_ON = "[X] "  # Playlist editor checkboxes, with the space before the title
+    CHECKBOX_OFF = "[ ] "
+    ROW_FMT_CACHE_SIZE = 1024  # Formatted rows kept before the cache is reset
+    VIS_COLUMNS = ("    ", "▁   ", "█▂  ", "██▃ ", "████")  # Visualizer bar of each height, bottom level first
+    LIST_PAD_ROWS = 1024  # Initial height of the list pad; grown when a list gets longer
+    # Progress bar pieces are sliced from these instead of built per frame
+    MAX_BAR_WIDTH = 512
+    _FULL_BAR = "█" * MAX_BAR_WIDTH
+    _EMPTY_BAR = "░" * MAX_BAR_WIDTH
+    _IDLE_BAR = "─" * MAX_BAR_WIDTH
+    
     def __init__(self, stdscr):
         self.stdscr = stdscr
         self.player = MusicPlayer()
@@ -510,38 +912,78 @@ class MusicPlayerUI:
         self.mode = "main"  # "main", "search", "results", "playlist_create", "playlist_view"
         self.status_message = "Press '/' to search, 'q' to quit"
         self.height, self.width = self.stdscr.getmaxyx()
+        self._hrule = "─" * (self.width - 1)  # Horizontal rule, rebuilt only when the width changes
         self.is_loading_more = False  # Track if we're loading more results
+        self._search_future = None  # Pending search, polled from the main loop
+        # Screen regions waiting to be redrawn by the main loop; anything (including
+        # worker threads) may set a flag, only the main loop draws
+        self._dirty = {'search': False, 'results': False, 'status': False, 'visualizer': False, 'controls': False}
+        self._load_more_future = None  # Pending "load more", polled from the main loop
+        # The main loop sleeps in select() while idle; a byte on this pipe wakes it early
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._main_thread_id = threading.get_ident()
+        # Main loop timers: a heap of (deadline, sequence, callback); callbacks reschedule themselves
+        self._timers = []
+        self._timer_seq = itertools.count()  # Tie-breaker so callbacks never get compared
+        self._scheduled = set()  # Callbacks currently in the heap
+        # Track loads run here one at a time, so rapid Enter presses can't race on VLC
+        self._io_worker = _DaemonWorker(name="ongaku-io")
+        self._play_future = None  # Most recently submitted track load
         self.scroll_offset = 0  # Track viewport scrolling
         # Calculate actual visible lines: results start at line 7, must stop before height-6 (visualizer)
         # Available space = (height - 6) - 7 = height - 13
         self.visible_lines = max(1, self.height - 13)  # Adjusted for actual space available and visualizer
-        self.volume_display_until = 0  # Timestamp until which to show volume
+        self.volume_display_until = 0  # time.monotonic() until which to show volume
         self.viewing_favorites = True  # Flag to track if we're viewing favorites in main mode
         self.playlist_creation_mode = False  # Track if we're creating a playlist
         self.playlist_selected_tracks = []  # Tracks selected for new playlist
+        self._playlist_selected_ids = set()  # IDs of playlist_selected_tracks, for O(1) checkbox lookups
+        self._playlist_tracks_owned = True  # False while playlist_selected_tracks is a playlist's own list
         self.playlist_name = ""  # Name for new playlist
+        self.playlist_name_confirmed = False  # Name entry is done; the editor is selecting tracks
         self.current_viewing_playlist = None  # Currently viewing playlist
         self.main_view_type = "combined"  # "combined", "favorites", or "playlists"
         self.editing_playlist_id = None  # ID of playlist being edited
         self.title_scroll_offset = 0  # Current scroll position for long titles
-        self.title_scroll_direction = 1  # 1 for right, -1 for left
-        self.last_title_scroll_update = 0  # Last time we updated title scroll
+        self._scroll_cache = None  # (title, repeat unit length, repeated title)
         self.resize_detected = False  # Flag for terminal resize detection
         self.visualizer = AudioVisualizer(bars=15)  # Audio visualizer
+        # The list views are drawn into a pad, one row per item; scrolling just shows another window of it
+        self._list_pad = curses.newpad(self.LIST_PAD_ROWS, max(1, self.width))
+        self._list_pad_stale = False  # Pad rows changed since the pad was last copied to the screen
+        self._row_cache = {}  # Shadow buffer: list index -> (line, duration, selected) or None (blank) as in the pad
+        self._row_cache_mode = None  # Mode the cached rows were drawn for
+        self._row_fmt_cache = {}  # (main_page, index, title, duration, favorite) -> (line, duration_str); editor rows too
+        self._controls_cache = {}  # (mode, width) -> (controls text, x position)
+        self._main_items_version = None  # player.library_version main_display_items was built from
+        self._last_bars = None  # Bar heights currently on screen (None: unknown, must draw)
+        self._status_shown = None  # (text, attr) of the status line on screen (None: unknown, must draw)
+        self._vis_rows = None  # Visualizer row strings currently on screen, bottom level first (None: area must be cleared first)
         
         # Connect visualizer to player for immediate clearing
         self.player.visualizer = self.visualizer
         
+        # Track the library size so clamping scroll never has to re-count it
+        self._library_size = len(self.player.favorites) + len(self.player.playlists)
+        self.player.on_library_changed = self._on_library_changed
+        
         # Setup resize detection
         signal.signal(signal.SIGWINCH, self.handle_resize)
         
         # Setup colors with terminal's default background
         curses.curs_set(0)
+        self.stdscr.leaveok(True)  # Cursor is hidden, so don't move it back after every update
         curses.use_default_colors()
         curses.init_pair(1, curses.COLOR_CYAN, -1)
         curses.init_pair(2, curses.COLOR_GREEN, -1)
         curses.init_pair(3, curses.COLOR_YELLOW, -1)
         curses.init_pair(4, curses.COLOR_RED, -1)
+        # Attributes used on every frame, looked up once
+        self._attr_accent = curses.color_pair(2)
+        self._attr_header = curses.color_pair(2) | curses.A_BOLD
+        self._attr_dim = curses.color_pair(3)
         
         # Draw static elements once
         self.draw_static_ui()
@@ -550,28 +992,44 @@ class MusicPlayerUI:
         """Handle terminal resize signal"""
         # Set flag safely without curses operations
         self.resize_detected = True
+        self._wake()
         
     def update_dimensions(self):
         """Update terminal dimensions and recalculate layout"""
+        changed = self._recalc_layout()
+        self._clamp_scroll()
+        self.resize_detected = False
+        return changed
+    
+    def _recalc_layout(self):
+        """Re-read the terminal size and rebuild size-dependent layout; only needed on resize"""
         old_height, old_width = self.height, self.width
         self.height, self.width = self.stdscr.getmaxyx()
+        if self.width != old_width:
+            self._hrule = "─" * (self.width - 1)
+            self._list_pad.resize(self._list_pad.getmaxyx()[0], max(1, self.width))
         
         # Recalculate visible lines based on new dimensions
         # Results start at line 7, must stop before height-6 (where visualizer starts)
         self.visible_lines = max(1, self.height - 13)
-        
-        # Adjust scroll offset if terminal got smaller
-        if hasattr(self, 'main_display_items'):
-            max_items = len(self.main_display_items)
+        self._row_cache.clear()
+        self._row_fmt_cache.clear()  # Title truncation depends on the width
+        self._controls_cache.clear()
+        self._last_bars = None
+        self._status_shown = None
+        self._vis_rows = None
+        return old_height != self.height or old_width != self.width
+    
+    def _clamp_scroll(self):
+        """Keep scroll offset and selection inside the current list"""
+        if self.mode == "main":
+            max_items = self._library_size
         elif self.mode == "playlist_view" and self.current_viewing_playlist:
             max_items = len(self.current_viewing_playlist.get('tracks', []))
-        elif self.mode in ["results", "main"]:
-            if self.mode == "main":
-                max_items = len(self.player.favorites) + len(self.player.playlists)
-            else:
-                max_items = len(self.player.search_results)
+        elif self.mode in ["playlist_create", "playlist_edit"]:
+            max_items = len(self.player.favorites)
         else:
-            max_items = 0
+            max_items = len(self.player.search_results)
         
         # Ensure scroll offset doesn't go beyond available items
         if max_items > 0:
@@ -581,33 +1039,33 @@ class MusicPlayerUI:
             # Ensure selected index is still visible
             if self.selected_index >= max_items:
                 self.selected_index = max(0, max_items - 1)
-        
-        self.resize_detected = False
-        return old_height != self.height or old_width != self.width
+    
+    def _on_library_changed(self):
+        """Player callback: favorites or playlists were added or removed"""
+        self._library_size = len(self.player.favorites) + len(self.player.playlists)
+        self._clamp_scroll()
         
     def draw_static_ui(self):
         """Draw static UI elements that don't change"""
         # Make sure we have minimum terminal size
         if self.height < 10 or self.width < 20:
             self.stdscr.addstr(0, 0, "Terminal too small")
-            self.stdscr.refresh()
             return
             
         try:
             header = "🎵 Ongaku 🎵"
             header_pos = max(0, (self.width - len(header)) // 2)
             self.stdscr.addstr(0, header_pos, header[:self.width-1], curses.color_pair(1) | curses.A_BOLD)
-            self.stdscr.addstr(1, 0, "─" * (self.width-1))
+            self.stdscr.addstr(1, 0, self._hrule)
             search_prompt = "Search: "
             if self.height > 3:
                 self.stdscr.addstr(3, 2, search_prompt, curses.color_pair(2))
             if self.height > 3:
-                self.stdscr.addstr(self.height - 3, 0, "─" * (self.width-1))
+                self.stdscr.addstr(self.height - 3, 0, self._hrule)
             self.draw_controls()
-            self.stdscr.refresh()
         except curses.error:
-            # If drawing fails, just refresh and continue
-            self.stdscr.refresh()
+            # If drawing fails, just continue
+            pass
         
     def update_search_bar(self):
         """Update only the search input area"""
@@ -620,12 +1078,90 @@ class MusicPlayerUI:
             self.stdscr.addstr(3, 2 + search_prompt_len, self.search_query + "_")
         else:
             self.stdscr.addstr(3, 2 + search_prompt_len, self.search_query)
-        self.stdscr.refresh()
     
-    def update_result_line(self, index):
+    def _build_row(self, item: Dict, index: int, main_page: bool = False) -> Tuple[str, str, bool]:
+        """Format one list row as (line, duration_str, selected)"""
+        selected = index == self.selected_index and self.mode in ["results", "main", "playlist_view"]
+        
+        # Formatting depends only on these; selection is drawn as an attribute
+        is_fav = not main_page and item.get('id', '') in self.player.favorite_ids
+        key = (main_page, index, item['title'], item.get('duration'), is_fav)
+        cached = self._row_fmt_cache.get(key)
+        if cached is not None:
+            return cached + (selected,)
+        
+        if main_page:
+            # Format duration for both favorites and playlists
+            duration_str = ""
+            if item.get('duration'):
+                duration_str = f"[{_fmt_time(int(item['duration']))}]"
+            
+            # Adjust title width based on whether we have duration
+            title_width = self.width - 10 if not duration_str else self.width - 20
+            title = item['title']
+            if len(title) > title_width:
+                title = title[:title_width]
+            line = f"{index+1:2}. {title}"
+        else:
+            # Playlist tracks and search results share the same row layout
+            duration = item.get('duration', 0)
+            if duration:
+                duration_str = f"[{_fmt_time(int(duration))}]"
+            else:
+                duration_str = self.NO_DURATION
+            
+            # Format result line
+            title = item['title']
+            title_width = self.width - 30
+            if len(title) > title_width:
+                title = title[:title_width]
+            
+            # Add favorite indicator
+            fav_indicator = "★ " if is_fav else "  "
+            line = f"{index+1:2}. {fav_indicator}{title}"
+        
+        if len(self._row_fmt_cache) >= self.ROW_FMT_CACHE_SIZE:
+            self._row_fmt_cache.clear()
+        self._row_fmt_cache[key] = (line, duration_str)
+        return (line, duration_str, selected)
+    
+    def _flush_row(self, index: int, row: Optional[Tuple[str, str, bool]]):
+        """Write a row into the list pad (or blank it if row is None), skipping it if the pad already holds it"""
+        # The cache mirrors the pad, so an unchanged row needs no output
+        old = self._row_cache.get(index, False)
+        if old == row:
+            return
+        self._row_cache[index] = row
+        self._list_pad_stale = True
+        pad = self._list_pad
+        
+        if row is None:
+            pad.move(index, 0)
+            pad.clrtoeol()
+            return
+        
+        line, duration_str, selected = row
+        # Only clear when the new text won't fully cover what was there before
+        if not old or len(old[0]) > len(line) or len(old[1]) > len(duration_str):
+            pad.move(index, 0)
+            pad.clrtoeol()
+        
+        duration_x = self.width - len(duration_str) - 2
+        if selected:
+            pad.addstr(index, 2, self.SELECTED_MARKER, self._attr_accent)
+            pad.addstr(index, 4, line, curses.A_REVERSE)
+            if duration_str and duration_x > 0:
+                pad.addstr(index, duration_x, duration_str, curses.A_REVERSE)
+        else:
+            pad.addstr(index, 2, self.ROW_PADDING + line)
+            if duration_str and duration_x > 0:
+                pad.addstr(index, duration_x, duration_str, self._attr_dim)
+    
+    def update_result_line(self, index: int):
         """Update a single result line"""
         # Determine which list to use
-        if self.mode == "main" and hasattr(self, 'main_display_items'):
+        main_page = self.mode == "main" and hasattr(self, 'main_display_items')
+        if main_page:
             # Use the combined display items for main page
             display_list = self.main_display_items
         elif self.mode == "main":
@@ -646,112 +1182,56 @@ class MusicPlayerUI:
         y_pos = 7 + display_index
         if y_pos >= self.height - 6:  # Don't draw outside bounds (stop where visualizer starts)
             return
-            
-        # Handle different item types for main page and playlist view
-        if self.mode == "main" and hasattr(self, 'main_display_items'):
-            item = display_list[index]
-            
-            # Clear the line
-            self.stdscr.move(y_pos, 2)
-            self.stdscr.clrtoeol()
-            
-            # Format duration for both favorites and playlists
-            duration_str = ""
-            if item.get('duration'):
-                duration = item['duration']
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                duration_str = f"[{minutes}:{seconds:02d}]"
-            
-            # Get title
-            title_width = self.width - 10 if not duration_str else self.width - 20
-            title = item['title'][:title_width] if len(item['title']) > title_width else item['title']
-            line = f"{index+1:2}. {title}"
-            
-            # Highlight selected item
-            if index == self.selected_index:
-                self.stdscr.addstr(y_pos, 2, "▶ ", curses.color_pair(2))
-                self.stdscr.addstr(y_pos, 4, line, curses.A_REVERSE)
-                if duration_str and self.width - len(duration_str) - 2 > 0:
-                    self.stdscr.addstr(y_pos, self.width - len(duration_str) - 2, duration_str, curses.A_REVERSE)
-            else:
-                self.stdscr.addstr(y_pos, 2, "  ")
-                self.stdscr.addstr(y_pos, 4, line)
-                if duration_str and self.width - len(duration_str) - 2 > 0:
-                    self.stdscr.addstr(y_pos, self.width - len(duration_str) - 2, duration_str, curses.color_pair(3))
-        elif self.mode == "playlist_view":
-            # Handle playlist tracks
-            result = display_list[index]
-            
-            # Clear the line
-            self.stdscr.move(y_pos, 2)
-            self.stdscr.clrtoeol()
-            
-            # Format duration
-            duration = result.get('duration', 0)
-            if duration:
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                duration_str = f"[{minutes}:{seconds:02d}]"
-            else:
-                duration_str = "[--:--]"
-            
-            # Format result line
-            title = result['title'][:self.width - 30] if len(result['title']) > self.width - 30 else result['title']
-            
-            # Add favorite indicator
-            fav_indicator = "★ " if self.player.is_favorite(result.get('id', '')) else "  "
-            line = f"{index+1:2}. {fav_indicator}{title}"
-            
-            # Highlight selected item
-            if index == self.selected_index:
-                self.stdscr.addstr(y_pos, 2, "▶ ", curses.color_pair(2))
-                self.stdscr.addstr(y_pos, 4, line, curses.A_REVERSE)
-                if self.width - len(duration_str) - 2 > 0:
-                    self.stdscr.addstr(y_pos, self.width - len(duration_str) - 2, duration_str, curses.A_REVERSE)
-            else:
-                self.stdscr.addstr(y_pos, 2, "  ")
-                self.stdscr.addstr(y_pos, 4, line)
-                if self.width - len(duration_str) - 2 > 0:
-                    self.stdscr.addstr(y_pos, self.width - len(duration_str) - 2, duration_str, curses.color_pair(3))
-        else:
-            # Original logic for search results
-            result = display_list[index]
-            
-            # Clear the line
-            self.stdscr.move(y_pos, 2)
-            self.stdscr.clrtoeol()
-            
-            # Format duration
-            duration = result.get('duration', 0)
-            if duration:
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                duration_str = f"[{minutes}:{seconds:02d}]"
-            else:
-                duration_str = "[--:--]"
-            
-            # Format result line
-            title = result['title'][:self.width - 30] if len(result['title']) > self.width - 30 else result['title']
-            
-            # Add favorite indicator
-            fav_indicator = "★ " if self.player.is_favorite(result.get('id', '')) else "  "
-            line = f"{index+1:2}. {fav_indicator}{title}"
-            
-            # Highlight selected item
-            if index == self.selected_index and self.mode in ["results", "main"]:
-                self.stdscr.addstr(y_pos, 2, "▶ ", curses.color_pair(2))
-                self.stdscr.addstr(y_pos, 4, line, curses.A_REVERSE)
-                self.stdscr.addstr(y_pos, self.width - len(duration_str) - 2, duration_str, curses.A_REVERSE)
-            else:
-                self.stdscr.addstr(y_pos, 2, "  ")
-                self.stdscr.addstr(y_pos, 4, line)
-                self.stdscr.addstr(y_pos, self.width - len(duration_str) - 2, duration_str, curses.color_pair(3))
+        
+        self._flush_row(index, self._build_row(display_list[index], index, main_page))
+    
+    def _flush_rows(self, display_list: List[Dict], main_page: bool = False):
+        """Write the visible window of display_list into the list pad; rows the pad already holds are skipped"""
+        rows = self.height - 13  # Results start at line 7 and stop where the visualizer starts
+        if rows <= 0:
+            return
+        self._ensure_pad_rows(self.scroll_offset + rows)
+        total = len(display_list)
+        for i in range(self.scroll_offset, self.scroll_offset + rows):
+            row = self._build_row(display_list[i], i, main_page) if i < total else None
+            self._flush_row(i, row)
+    
+    def _ensure_pad_rows(self, rows: int):
+        """Grow the list pad so it has at least the given number of rows"""
+        pad_rows = self._list_pad.getmaxyx()[0]
+        if rows > pad_rows:
+            while pad_rows < rows:
+                pad_rows *= 2
+            self._list_pad.resize(pad_rows, max(1, self.width))
+    
+    def _refresh_list_pad(self):
+        """Copy the visible window of the list pad onto the screen, if any of its rows changed"""
+        if not self._list_pad_stale:
+            return
+        self._list_pad_stale = False
+        last_line = self.height - 7  # Last line above the visualizer
+        if last_line < 7:
+            return
+        rows = last_line - 6
+        self._ensure_pad_rows(self.scroll_offset + rows)
+        # Touched so the window wins over whatever stdscr last put on those lines
+        self._list_pad.touchline(self.scroll_offset, rows)
+        self._list_pad.noutrefresh(self.scroll_offset, 0, 7, 0, last_line, self.width - 1)
     
     def draw_results(self):
         """Draw search results, favorites, playlists, or playlist tracks"""
         height, width = self.stdscr.getmaxyx()
         
+        # Rows drawn for another view don't describe what's on screen now
+        if self.mode != self._row_cache_mode:
+            self._row_cache.clear()
+            self._row_fmt_cache.clear()
+            self._row_cache_mode = self.mode
+        
+        # The header/message line is rewritten below
+        self.stdscr.move(5, 0)
+        self.stdscr.clrtoeol()
+        
         # Determine what to display
         if self.mode == "main":
             # Show both playlists and favorites on main page
@@ -762,16 +1242,22 @@ class MusicPlayerUI:
                 display_list = self.current_viewing_playlist.get('tracks', [])
                 if not display_list:
                     self.stdscr.addstr(5, 2, "This playlist is empty.", curses.color_pair(3))
+                    self._flush_rows(display_list)
                     return
             else:
                 return
         elif self.mode == "playlist_create" or self.mode == "playlist_edit":
+            # Paints the results area itself, onto a blanked area
+            self._row_cache.clear()
+            for line_num in range(6, height - 6):
+                self.stdscr.hline(line_num, 0, ' ', width)
             self.draw_playlist_creation()
             return
         else:
             display_list = self.player.search_results
             if not display_list:
                 self.stdscr.addstr(5, 2, "No results. Press '/' to search.", curses.color_pair(3))
+                self._flush_rows(display_list)
                 return
         
         # Recalculate visible lines based on current terminal size
@@ -783,76 +1269,27 @@ class MusicPlayerUI:
         self.visible_lines = max(1, actual_visible_lines)
         
         # Results header
-        total = len(display_list)
         if self.mode == "playlist_view":
             header = f"{self.current_viewing_playlist['name']}"
         else:
-            header = "Search Results"
-        self.stdscr.addstr(5, 2, header, curses.color_pair(2) | curses.A_BOLD)
-        
-        # Clear the results area first
-        for line_num in range(results_start_line, results_end_line):
-            self.stdscr.move(line_num, 0)
-            self.stdscr.clrtoeol()
+            header = self.HEADER_RESULTS
+        self.stdscr.addstr(5, 2, header, self._attr_header)
         
         # Display only visible results within the viewport
-        display_row = 0
-        for i in range(self.scroll_offset, min(self.scroll_offset + self.visible_lines, total)):
-            y_pos = results_start_line + display_row
-            
-            # Make sure we don't draw outside screen bounds
-            if y_pos >= results_end_line:
-                break
-                
-            result = display_list[i]
-            
-            # Format duration
-            duration = result['duration']
-            if duration:
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                duration_str = f"[{minutes}:{seconds:02d}]"
-            else:
-                duration_str = "[--:--]"
-            
-            # Format result line
-            title = result['title'][:width - 30] if len(result['title']) > width - 30 else result['title']
-            
-            # Add favorite indicator
-            fav_indicator = "★ " if self.player.is_favorite(result.get('id', '')) else "  "
-            line = f"{i+1:2}. {fav_indicator}{title}"
-            
-            # Highlight selected item
-            if i == self.selected_index and self.mode in ["results", "main", "playlist_view"]:
-                self.stdscr.addstr(y_pos, 2, "▶ ", curses.color_pair(2))
-                self.stdscr.addstr(y_pos, 4, line, curses.A_REVERSE)
-                if width - len(duration_str) - 2 > 0:
-                    self.stdscr.addstr(y_pos, width - len(duration_str) - 2, duration_str, curses.A_REVERSE)
-            else:
-                self.stdscr.addstr(y_pos, 4, line)
-                if width - len(duration_str) - 2 > 0:
-                    self.stdscr.addstr(y_pos, width - len(duration_str) - 2, duration_str, curses.color_pair(3))
-            
-            display_row += 1
+        self._flush_rows(display_list)
     
-    def draw_main_page(self):
-        """Draw the main page with playlists and favorites"""
-        height, width = self.stdscr.getmaxyx()
-        
-        # Combine playlists and favorites for display
+    def _build_main_items(self) -> List[Dict]:
+        """Combine playlists and favorites into the main page's display list"""
         display_items = []
         
         # Add playlists first
         for playlist in self.player.playlists:
-            # Calculate total duration of all tracks in playlist
             tracks = playlist.get('tracks', [])
-            total_duration = sum(track.get('duration', 0) for track in tracks)
-            
             display_items.append({
                 'type': 'playlist',
                 'data': playlist,
                 'title': f"★ {playlist['name']} ({len(tracks)} tracks)",
-                'duration': total_duration
+                'duration': self.player.playlist_duration(playlist.get('id'))
             })
         
         # Add favorites
@@ -863,61 +1300,26 @@ class MusicPlayerUI:
                 'title': f"★ {fav['title']}",
                 'duration': fav.get('duration', 0)
             })
+        return display_items
+    
+    def draw_main_page(self):
+        """Draw the main page with playlists and favorites"""
+        # Rebuild the combined list only when the library has changed since last time
+        if self._main_items_version != self.player.library_version:
+            self.main_display_items = self._build_main_items()
+            self._main_items_version = self.player.library_version
+        display_items = self.main_display_items
         
         if not display_items:
             self.stdscr.addstr(5, 2, "No playlists or favorites yet. Press '/' to search, 'F' to favorite, 'E' to create playlist.", curses.color_pair(3))
+            self._flush_rows(display_items)
             return
         
         # Header
-        header = "Home"
-        self.stdscr.addstr(5, 2, header, curses.color_pair(2) | curses.A_BOLD)
-        
-        # Clear the results area
-        results_start_line = 7
-        results_end_line = height - 6  # Stop where visualizer starts
-        for line_num in range(results_start_line, results_end_line):
-            self.stdscr.move(line_num, 0)
-            self.stdscr.clrtoeol()
+        self.stdscr.addstr(5, 2, self.HEADER_HOME, self._attr_header)
         
         # Display items
-        total = len(display_items)
-        display_row = 0
-        for i in range(self.scroll_offset, min(self.scroll_offset + self.visible_lines, total)):
-            y_pos = results_start_line + display_row
-            
-            if y_pos >= results_end_line:
-                break
-            
-            item = display_items[i]
-            
-            # Format duration for both favorites and playlists
-            duration_str = ""
-            if item.get('duration'):
-                duration = item['duration']
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                duration_str = f"[{minutes}:{seconds:02d}]"
-            
-            # Adjust title width based on whether we have duration
-            title_width = width - 10 if not duration_str else width - 20
-            title = item['title'][:title_width] if len(item['title']) > title_width else item['title']
-            line = f"{i+1:2}. {title}"
-            
-            # Highlight selected item
-            if i == self.selected_index:
-                self.stdscr.addstr(y_pos, 2, "▶ ", curses.color_pair(2))
-                self.stdscr.addstr(y_pos, 4, line, curses.A_REVERSE)
-                if duration_str and width - len(duration_str) - 2 > 0:
-                    self.stdscr.addstr(y_pos, width - len(duration_str) - 2, duration_str, curses.A_REVERSE)
-            else:
-                self.stdscr.addstr(y_pos, 4, line)
-                if duration_str and width - len(duration_str) - 2 > 0:
-                    self.stdscr.addstr(y_pos, width - len(duration_str) - 2, duration_str, curses.color_pair(3))
-            
-            display_row += 1
-        
-        # Store display items for navigation
-        self.main_display_items = display_items
+        self._flush_rows(display_items, main_page=True)
     
     def draw_playlist_creation(self):
         """Draw playlist creation interface"""
@@ -925,14 +1327,14 @@ class MusicPlayerUI:
         
         # Header
         header_text = "Editing Playlist" if self.mode == "playlist_edit" else "Creating New Playlist"
-        self.stdscr.addstr(5, 2, header_text, curses.color_pair(2) | curses.A_BOLD)
+        self.stdscr.addstr(5, 2, header_text, self._attr_header)
         
         # Playlist name input
         self.stdscr.addstr(7, 2, "Playlist Name: ")
         
         # Check if we're still entering the name or selecting tracks
-        is_name_confirmed = self.playlist_name.endswith("_CONFIRMED")
-        display_name = self.playlist_name.replace("_CONFIRMED", "")
+        is_name_confirmed = self.playlist_name_confirmed
+        display_name = self.playlist_name
         
         if not is_name_confirmed:
             # Still entering name - show cursor
@@ -954,15 +1356,12 @@ class MusicPlayerUI:
             # Calculate actual visible lines for this view
             actual_visible_lines = results_end_line - results_start_line
             
-            # Clear the area
-            for line_num in range(results_start_line, results_end_line):
-                self.stdscr.move(line_num, 0)
-                self.stdscr.clrtoeol()
-            
             # Display favorites with checkboxes (with scrolling support)
             display_row = 0
             total = len(self.player.favorites)
             
+            title_width = width - 15
+            
             # Display only items within the viewport - using the same pattern as draw_results
             for i in range(self.scroll_offset, min(self.scroll_offset + actual_visible_lines, total)):
                 y_pos = results_start_line + display_row
@@ -971,65 +1370,72 @@ class MusicPlayerUI:
                 if y_pos >= results_end_line:
                     break
                 
-                fav = self.player.favorites[i]
-                
-                # Check if selected
-                is_selected = any(t.get('id') == fav.get('id') for t in self.playlist_selected_tracks)
-                checkbox = "[X]" if is_selected else "[ ]"
-                
-                title = fav['title'][:width - 15] if len(fav['title']) > width - 15 else fav['title']
-                line = f"{checkbox} {title}"
+                line = self._build_editor_line(self.player.favorites[i], title_width)
                 
                 # Highlight current item
                 if i == self.selected_index:
-                    self.stdscr.addstr(y_pos, 2, "▶ ", curses.color_pair(2))
+                    self.stdscr.addstr(y_pos, 2, self.SELECTED_MARKER, self._attr_accent)
                     self.stdscr.addstr(y_pos, 4, line, curses.A_REVERSE)
                 else:
                     self.stdscr.addstr(y_pos, 4, line)
                 
                 display_row += 1
     
+    def _layout_controls(self):
+        """Pick and position the controls text for the current mode and width"""
+        if self.mode == "playlist_create":
+            controls = "Enter : Create | Space : Toggle | ESC : Cancel"
+        elif self.mode == "playlist_edit":
+            controls = "Enter : Update | Space : Toggle | D : Delete | ESC : Cancel"
+        elif self.mode == "playlist_view":
+            controls = "Enter : Play | E : Edit | ESC : Main | q : Quit"
+        else:
+            controls = "/ : Search | ↑↓ : Navigate | Enter : Play/Open | F : Fav | E : Playlist | Space : Pause | ESC : Main | q : Quit"
+            if len(controls) > self.width:
+                controls = "/ : Search | Enter : Play | F : Fav | E : Playlist | Space : Pause | q : Quit"
+        
+        # Truncate to fit and ensure we don't go out of bounds
+        controls = controls[:self.width-1]
+        x_pos = max(0, min((self.width - len(controls)) // 2, self.width - len(controls) - 1))
+        return controls, x_pos
+    
     def draw_controls(self):
         """Draw controls line (static)"""
         if self.height < 2:
             return  # Not enough space for controls
             
         try:
-            if self.mode == "playlist_create":
-                controls = "Enter : Create | Space : Toggle | ESC : Cancel"
-            elif self.mode == "playlist_edit":
-                controls = "Enter : Update | Space : Toggle | D : Delete | ESC : Cancel"
-            elif self.mode == "playlist_view":
-                controls = "Enter : Play | E : Edit | ESC : Main | q : Quit"
-            else:
-                controls = "/ : Search | ↑↓ : Navigate | Enter : Play/Open | F : Fav | E : Playlist | Space : Pause | ESC : Main | q : Quit"
-                if len(controls) > self.width:
-                    controls = "/ : Search | Enter : Play | F : Fav | E : Playlist | Space : Pause | q : Quit"
-            
-            # Truncate to fit and ensure we don't go out of bounds
-            controls = controls[:self.width-1]
-            x_pos = max(0, min((self.width - len(controls)) // 2, self.width - len(controls) - 1))
-            self.stdscr.addstr(self.height - 1, x_pos, controls, curses.color_pair(3))
+            # The text only depends on mode and width, so lay it out once per pair
+            key = (self.mode, self.width)
+            layout = self._controls_cache.get(key)
+            if layout is None:
+                layout = self._controls_cache[key] = self._layout_controls()
+            controls, x_pos = layout
+            self.stdscr.move(self.height - 1, 0)
+            self.stdscr.clrtoeol()
+            self.stdscr.addstr(self.height - 1, x_pos, controls, self._attr_dim)
         except curses.error:
             # If controls can't be drawn, just skip them
             pass
     
-    def get_scrollable_title(self, title, max_width):
+    def get_scrollable_title(self, title: str, max_width: int) -> str:
         """Get scrollable version of title if it's too long"""
         if len(title) <= max_width:
             self.title_scroll_offset = 0  # Reset scroll for short titles
             return title
         
-        # Create seamless repeating text: "Title   Title   Title   "
-        separator = "   "  # 3 spaces between repetitions
-        repeat_unit = title + separator
-        
-        # Create enough repetitions to fill any possible scroll position
-        # We need at least 3 repetitions to ensure seamless scrolling
-        repeated_title = repeat_unit * 3
+        cached = self._scroll_cache
+        if cached is None or cached[0] != title:
+            # Create seamless repeating text: "Title   Title   Title   "
+            separator = "   "  # 3 spaces between repetitions
+            repeat_unit = title + separator
+            # Built once per title; new titles start scrolling from the beginning
+            cached = self._scroll_cache = (title, len(repeat_unit), repeat_unit * 3)
+            self.title_scroll_offset = 0
+        _, unit_len, repeated_title = cached
         
         # Reset scroll when we've scrolled through one complete cycle
-        if self.title_scroll_offset >= len(repeat_unit):
+        if self.title_scroll_offset >= unit_len:
             self.title_scroll_offset = 0
         
         # Extract the visible portion
@@ -1041,19 +1447,13 @@ class MusicPlayerUI:
         
         return visible_text
     
-    def update_title_scroll(self):
-        """Update title scrolling animation"""
-        current_time = time.time()
-        if current_time - self.last_title_scroll_update >= 0.15:  # Update every 150ms (faster)
-            self.title_scroll_offset += 1
-            self.last_title_scroll_update = current_time
-            return True
-        return False
-
     def draw_visualizer(self):
         """Draw audio visualizer bars at the bottom"""
         # Get visualizer data
         bars = self.visualizer.get_bars(max_height=4)  # Smaller height for bottom placement
+        if bars == self._last_bars:
+            return  # Same frame as what's already on screen
+        self._last_bars = bars
         
         # Calculate position - center it horizontally
         visualizer_width = len(bars) * 2  # 2 chars per bar (bar + space)
@@ -1067,71 +1467,58 @@ class MusicPlayerUI:
             return
             
         try:
-            # Clear the visualizer area
-            for y in range(visualizer_y, visualizer_y + visualizer_height):
-                if y >= 0 and y < self.height - 2:
-                    self.stdscr.move(y, 0)
-                    self.stdscr.clrtoeol()
-            
-            # Only draw if there's audio activity
-            if any(bar > 0 for bar in bars):
-                # Draw bars from bottom up
-                bar_chars = ["▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"]
-                
-                for i, height in enumerate(bars):
-                    x_pos = start_x + (i * 2)
-                    if x_pos >= self.width - 1:
-                        break
-                        
-                    # Draw the bar from bottom to top
-                    for y in range(visualizer_height):
-                        y_pos = visualizer_y + (visualizer_height - 1 - y)  # Start from bottom
-                        if y_pos < 0 or y_pos >= self.height - 2:
-                            continue
-                            
-                        if y < height:
-                            # Use different characters for different heights
-                            if y == height - 1 and height < visualizer_height:
-                                # Top of bar - use partial character
-                                char_idx = min(height - 1, len(bar_chars) - 1)
-                                self.stdscr.addstr(y_pos, x_pos, bar_chars[char_idx], curses.color_pair(2))
-                            else:
-                                # Full bar segment
-                                self.stdscr.addstr(y_pos, x_pos, "█", curses.color_pair(2))
+            shown = self._vis_rows
+            if shown is None:
+                # Unknown screen contents - clear the area once, then diff against blanks
+                for y in range(visualizer_y, visualizer_y + visualizer_height):
+                    if y >= 0 and y < self.height - 2:
+                        self.stdscr.move(y, 0)
+                        self.stdscr.clrtoeol()
+                shown = self._vis_rows = [""] * visualizer_height
+            
+            # Bars that fit before the right edge
+            fitting = max(0, (self.width - start_x) // 2)
+            columns = [self.VIS_COLUMNS[min(height, visualizer_height)] for height in bars[:fitting]]
+            color = self._attr_accent
+            
+            # One string per row, bottom level first; rows that didn't change aren't written
+            for y in range(visualizer_height):
+                y_pos = visualizer_y + (visualizer_height - 1 - y)  # Start from bottom
+                if y_pos < 0 or y_pos >= self.height - 2:
+                    continue
+                row = " ".join([column[y] for column in columns])
+                if row != shown[y]:
+                    self.stdscr.addstr(y_pos, start_x, row, color)
+                    shown[y] = row
                         
         except curses.error:
             # If drawing fails, just skip the visualizer
             pass
 
-    def format_time(self, seconds):
+    def format_time(self, seconds: float) -> str:
         """Format seconds as MM:SS"""
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes}:{seconds:02d}"
+        return _fmt_time(int(seconds))
     
-    def draw_progress_bar(self, current_time, duration, progress, bar_width=30):
+    def draw_progress_bar(self, current_time: float, duration: float, progress: float, bar_width: int = 30) -> str:
         """Draw a progress bar"""
+        bar_width = min(bar_width, self.MAX_BAR_WIDTH)
         if duration <= 0:
-            return "[--:--] " + "─" * bar_width + " [--:--]"
+            return f"[--:--] {self._IDLE_BAR[:bar_width]} [--:--]"
         
-        filled = int(progress * bar_width)
+        filled = max(0, min(bar_width, int(progress * bar_width)))  # Negative slices would count from the end
         empty = bar_width - filled
         
         current_str = self.format_time(current_time)
         duration_str = self.format_time(duration)
         
-        bar = "█" * filled + "░" * empty
-        return f"[{current_str}] {bar} [{duration_str}]"
+        return f"[{current_str}] {self._FULL_BAR[:filled]}{self._EMPTY_BAR[:empty]} [{duration_str}]"
     
     def update_status(self):
         """Update only the status line"""
         import time
-        current_time_stamp = time.time()
-        show_volume = current_time_stamp < self.volume_display_until
-        
-        # Clear status line
-        self.stdscr.move(self.height - 2, 2)
-        self.stdscr.clrtoeol()
+        show_volume = time.monotonic() < self.volume_display_until
+        # Lines are padded to the full width so one write also blanks the old text
+        status_width = self.width - 3
         
         # Now playing with progress bar or status message
         if self.player.is_playing and self.player.current_track:
@@ -1174,7 +1561,7 @@ class MusicPlayerUI:
                     time_info = f"{time_current}/{time_duration}" if duration > 0 else "Playing"
                     line = f"{music_icon}{time_info}"
             
-            self.stdscr.addstr(self.height - 2, 2, line[:self.width-3], curses.color_pair(2))
+            self._write_status(_clip_to_columns(line, status_width), self._attr_accent)
         else:
             # Show volume temporarily when not playing
             if show_volume:
@@ -1182,31 +1569,40 @@ class MusicPlayerUI:
                 status_line = self.status_message + volume_info
             else:
                 status_line = self.status_message
-            self.stdscr.addstr(self.height - 2, 2, status_line[:self.width-3])
-        
-        self.stdscr.refresh()
+            self._write_status(_clip_to_columns(status_line, status_width), 0)
+    
+    def _write_status(self, text, attr):
+        """Write the status line and clear the rest of the row, unless the screen already shows exactly that"""
+        if (text, attr) == self._status_shown:
+            return
+        self._status_shown = (text, attr)
+        self.stdscr.addstr(self.height - 2, 2, text, attr)
+        self.stdscr.clrtoeol()
+    
+    def _read_printable_burst(self, key):
+        """Return key plus any printable keys already queued behind it (a paste), as one string"""
+        # getch() doesn't block in the main loop, so this stops at the end of the burst
+        chars = [chr(key)]
+        while True:
+            next_key = self.stdscr.getch()
+            if next_key == -1:
+                break
+            if not 32 <= next_key <= 126:
+                curses.ungetch(next_key)  # Leave it for the main loop
+                break
+            chars.append(chr(next_key))
+        return "".join(chars)
     
     def handle_search_input(self, key):
         """Handle input in search mode"""
         if key == 10:  # Enter
             if self.search_query:
                 self.status_message = "Searching..."
-                self.update_status()
-                
-                # Perform search
-                results = self.player.search_youtube(self.search_query)
-                self.player.search_results = results
+                self._mark_dirty('status')
                 
-                if results:
-                    self.mode = "results"
-                    self.selected_index = 0
-                    self.prev_selected_index = -1
-                    self.scroll_offset = 0  # Reset scroll position
-                    self.status_message = f"Showing {len(results)} results (scroll down for more)"
-                    return True  # Need full redraw for results
-                else:
-                    self.status_message = "No results found"
-                    self.update_status()
+                # Search in the background; the main loop picks up the results
+                self._search_future = self._wake_when_done(self.player.search_youtube_async(self.search_query))
+                self._drop_load_more()  # Results for the old query are no longer wanted
                     
         elif key == 27:  # Escape - exit search mode
             if self.player.search_results:
@@ -1214,8 +1610,8 @@ class MusicPlayerUI:
                 self.status_message = f"Showing {len(self.player.search_results)} results"
             else:
                 self.mode = "main"
-                self.status_message = "★ Favorites" if self.player.favorites else "No favorites yet"
-            self.update_search_bar()
+                self.status_message = self.STATUS_FAVORITES if self.player.favorites else self.STATUS_NO_FAVORITES
+            self._mark_view_changed()
             return False
             
         elif key == curses.KEY_BACKSPACE or key == 127:
@@ -1224,7 +1620,7 @@ class MusicPlayerUI:
             return False
             
         elif 32 <= key <= 126:  # Printable characters
-            self.search_query += chr(key)
+            self.search_query += self._read_printable_burst(key)
             self.update_search_bar()
             return False
         
@@ -1235,11 +1631,11 @@ class MusicPlayerUI:
         # If selected item is above viewport, scroll up
         if self.selected_index < self.scroll_offset:
             self.scroll_offset = self.selected_index
-            return True  # Need full redraw
+            return True  # Viewport moved
         # If selected item is below viewport, scroll down
         elif self.selected_index >= self.scroll_offset + self.visible_lines:
             self.scroll_offset = self.selected_index - self.visible_lines + 1
-            return True  # Need full redraw
+            return True  # Viewport moved
         return False
     
     def handle_main_input(self, key):
@@ -1248,14 +1644,16 @@ class MusicPlayerUI:
             if key == ord('E') or key == ord('e'):  # Start playlist creation
                 if not self.player.favorites:
                     self.status_message = "Add some favorites first before creating a playlist!"
-                    self.update_status()
+                    self._mark_dirty('status')
                 else:
                     self.mode = "playlist_create"
                     self.playlist_name = ""
-                    self.playlist_selected_tracks = []
+                    self.playlist_name_confirmed = False
+                    self._set_playlist_selection([])
                     self.selected_index = 0
                     self.scroll_offset = 0  # Reset scroll position
-                    return True
+                    self._mark_view_changed()
+                    return False
             return False
             
         if key == curses.KEY_UP:
@@ -1266,12 +1664,12 @@ class MusicPlayerUI:
                 
                 # Check if we need to scroll the viewport
                 if self.adjust_viewport():
-                    return True  # Need full redraw
+                    self._mark_dirty('results')
+                    return False
                 else:
                     # Update only the two affected lines
                     self.update_result_line(self.prev_selected_index)
                     self.update_result_line(self.selected_index)
-                    self.stdscr.refresh()
             return False
             
         elif key == curses.KEY_DOWN:
@@ -1283,12 +1681,12 @@ class MusicPlayerUI:
                 
                 # Check if we need to scroll the viewport
                 if self.adjust_viewport():
-                    return True  # Need full redraw
+                    self._mark_dirty('results')
+                    return False
                 else:
                     # Update only the two affected lines
                     self.update_result_line(self.prev_selected_index)
                     self.update_result_line(self.selected_index)
-                    self.stdscr.refresh()
             return False
             
         elif key == 10:  # Enter - play selected or open playlist
@@ -1302,7 +1700,8 @@ class MusicPlayerUI:
                     self.selected_index = 0
                     self.scroll_offset = 0
                     self.status_message = f"Playlist: {item['data']['name']}"
-                    return True
+                    self._mark_view_changed()
+                    return False
                 else:
                     # Play favorite track
                     selected = item['data']
@@ -1310,8 +1709,7 @@ class MusicPlayerUI:
                     
                     # Clear visualizer immediately in main thread
                     self.visualizer.clear_immediately()
-                    self.draw_visualizer()  # Redraw to show cleared state
-                    self.stdscr.refresh()
+                    self._mark_dirty('visualizer')  # Redraw to show cleared state
                     
                     # Play in background thread to avoid blocking UI
                     def play_async():
@@ -1320,12 +1718,10 @@ class MusicPlayerUI:
                             self.status_message = f"Playing: {selected['title'][:50]}"
                         else:
                             self.status_message = "Failed to load track"
-                        self.update_status()
+                        self._mark_dirty('status')
                     
-                    thread = threading.Thread(target=play_async)
-                    thread.daemon = True
-                    thread.start()
-                    self.update_status()
+                    self._submit_play(play_async)
+                    self._mark_dirty('status')
                 
         elif key == ord('F') or key == ord('f'):  # Remove from favorites (only for favorite items)
             if self.main_display_items and self.selected_index < len(self.main_display_items):
@@ -1339,19 +1735,22 @@ class MusicPlayerUI:
                     if self.selected_index >= len(self.main_display_items) - 1 and self.selected_index > 0:
                         self.selected_index -= 1
                     
-                    self.update_status()
-                    return True  # Need full redraw
+                    self._mark_dirty('status')
+                    self._mark_dirty('results')
+                    return False
                     
         elif key == ord('E') or key == ord('e'):  # Start playlist creation
             if not self.player.favorites:
                 self.status_message = "Add some favorites first before creating a playlist!"
-                self.update_status()
+                self._mark_dirty('status')
             else:
                 self.mode = "playlist_create"
                 self.playlist_name = ""
-                self.playlist_selected_tracks = []
+                self.playlist_name_confirmed = False
+                self._set_playlist_selection([])
                 self.selected_index = 0
-                return True
+                self._mark_view_changed()
+                return False
         
         return False
     
@@ -1365,12 +1764,12 @@ class MusicPlayerUI:
                 
                 # Check if we need to scroll the viewport
                 if self.adjust_viewport():
-                    return True  # Need full redraw
+                    self._mark_dirty('results')
+                    return False
                 else:
                     # Update only the two affected lines
                     self.update_result_line(self.prev_selected_index)
                     self.update_result_line(self.selected_index)
-                    self.stdscr.refresh()
             return False
             
         elif key == curses.KEY_DOWN:
@@ -1379,29 +1778,10 @@ class MusicPlayerUI:
                 # At the last result, try to load more
                 self.is_loading_more = True
                 self.status_message = "Loading more results..."
-                self.update_status()
-                
-                # Load more in a thread
-                def load_more_async():
-                    new_results = self.player.fetch_more_results(10)
-                    if new_results:
-                        self.player.search_results.extend(new_results)
-                        self.status_message = f"Showing {len(self.player.search_results)} results"
-                    else:
-                        self.status_message = f"Showing all {len(self.player.search_results)} results found"
-                    self.is_loading_more = False
-                    # Force a full redraw to show new results properly
-                    self.stdscr.clear()
-                    self.draw_static_ui()
-                    self.update_search_bar()
-                    self.draw_results()
-                    self.update_status()
-                    
-                thread = threading.Thread(target=load_more_async)
-                thread.daemon = True
-                thread.start()
+                self._mark_dirty('status')
                 
-                # Update the main event loop that we need a redraw later
+                # Load more in the background; the main loop picks up the results
+                self._load_more_future = self._wake_when_done(self.player.fetch_more_results_async(10))
                 return False
             
             new_index = min(len(self.player.search_results) - 1, self.selected_index + 1)
@@ -1411,12 +1791,12 @@ class MusicPlayerUI:
                 
                 # Check if we need to scroll the viewport
                 if self.adjust_viewport():
-                    return True  # Need full redraw
+                    self._mark_dirty('results')
+                    return False
                 else:
                     # Update only the two affected lines
                     self.update_result_line(self.prev_selected_index)
                     self.update_result_line(self.selected_index)
-                    self.stdscr.refresh()
             return False
             
         elif key == 10:  # Enter - play selected
@@ -1427,8 +1807,7 @@ class MusicPlayerUI:
                 
                 # Clear visualizer immediately in main thread
                 self.visualizer.clear_immediately()
-                self.draw_visualizer()  # Redraw to show cleared state
-                self.stdscr.refresh()
+                self._mark_dirty('visualizer')  # Redraw to show cleared state
                 
                 # Play in background thread to avoid blocking UI
                 def play_async():
@@ -1437,12 +1816,10 @@ class MusicPlayerUI:
                         self.status_message = f"Playing: {selected['title'][:50]}"
                     else:
                         self.status_message = "Failed to load track"
-                    self.update_status()
+                    self._mark_dirty('status')
                 
-                thread = threading.Thread(target=play_async)
-                thread.daemon = True
-                thread.start()
-                self.update_status()
+                self._submit_play(play_async)
+                self._mark_dirty('status')
                 
         elif key == ord('F') or key == ord('f'):  # Add/remove from favorites
             if self.player.search_results and self.selected_index < len(self.player.search_results):
@@ -1453,19 +1830,38 @@ class MusicPlayerUI:
                 else:
                     self.player.add_to_favorites(track)
                     self.status_message = f"Added to favorites: {track['title'][:50]}"
-                self.update_status()
-                return True  # Need full redraw to update star indicators
+                self._mark_dirty('status')
+                self.update_result_line(self.selected_index)  # Only this row's star changed
+                return False
                 
         elif key == 27:  # ESC - return to main menu
-            self.mode = "main"
-            self.search_query = ""  # Clear search when returning to main
-            self.selected_index = 0 if self.player.favorites else 0
-            self.scroll_offset = 0
-            self.status_message = "★ Favorites" if self.player.favorites else "No favorites yet"
-            return True  # Need full redraw
+            self._reset_to_main()
+            return False
         
         return False
     
+    def _set_playlist_selection(self, tracks, owned=True):
+        """Replace the tracks selected in the playlist editor; owned=False shares the list until it is modified"""
+        self.playlist_selected_tracks = tracks
+        self._playlist_tracks_owned = owned
+        self._playlist_selected_ids = {t.get('id') for t in tracks}
+    
+    def _build_editor_line(self, fav: Dict, title_width: int) -> str:
+        """Format a playlist editor row: checkbox plus truncated title"""
+        is_selected = fav.get('id') in self._playlist_selected_ids
+        key = ('editor', fav['title'], title_width, is_selected)
+        line = self._row_fmt_cache.get(key)
+        if line is None:
+            checkbox = self.CHECKBOX_ON if is_selected else self.CHECKBOX_OFF
+            title = fav['title']
+            if len(title) > title_width:
+                title = title[:title_width]
+            line = checkbox + title
+            if len(self._row_fmt_cache) >= self.ROW_FMT_CACHE_SIZE:
+                self._row_fmt_cache.clear()
+            self._row_fmt_cache[key] = line
+        return line
+    
     def update_playlist_creation_line(self, index):
         """Update a single line in playlist creation mode"""
         height, width = self.stdscr.getmaxyx()
@@ -1484,27 +1880,18 @@ class MusicPlayerUI:
         if y_pos >= results_end_line:
             return
             
-        fav = self.player.favorites[index]
+        line = self._build_editor_line(self.player.favorites[index], width - 15)
         
         # Clear the line
         self.stdscr.move(y_pos, 2)
         self.stdscr.clrtoeol()
         
-        # Check if selected
-        is_selected = any(t.get('id') == fav.get('id') for t in self.playlist_selected_tracks)
-        checkbox = "[X]" if is_selected else "[ ]"
-        
-        title = fav['title'][:width - 15] if len(fav['title']) > width - 15 else fav['title']
-        line = f"{checkbox} {title}"
-        
         # Highlight current item if it's the selected index
         if index == self.selected_index:
-            self.stdscr.addstr(y_pos, 2, "▶ ", curses.color_pair(2))
+            self.stdscr.addstr(y_pos, 2, self.SELECTED_MARKER, self._attr_accent)
             self.stdscr.addstr(y_pos, 4, line, curses.A_REVERSE)
         else:
             self.stdscr.addstr(y_pos, 4, line)
-        
-        self.stdscr.refresh()
     
     def update_playlist_name_input(self):
         """Update only the playlist name input line"""
@@ -1513,8 +1900,8 @@ class MusicPlayerUI:
         self.stdscr.clrtoeol()
         
         # Check if we're still entering the name or selecting tracks
-        is_name_confirmed = self.playlist_name.endswith("_CONFIRMED")
-        display_name = self.playlist_name.replace("_CONFIRMED", "")
+        is_name_confirmed = self.playlist_name_confirmed
+        display_name = self.playlist_name
         
         if not is_name_confirmed:
             # Still entering name - show cursor
@@ -1522,30 +1909,31 @@ class MusicPlayerUI:
         else:
             # Name confirmed - show without cursor
             self.stdscr.addstr(7, 17, display_name)
-        
-        self.stdscr.refresh()
     
     def handle_playlist_creation_input(self, key):
         """Handle input in playlist creation mode"""
-        if len(self.playlist_selected_tracks) == 0 and not self.playlist_name.endswith("_CONFIRMED"):
+        if len(self.playlist_selected_tracks) == 0 and not self.playlist_name_confirmed:
             # Entering playlist name
             if key == 10:  # Enter - finish name entry
                 if self.playlist_name:
-                    self.playlist_name += "_CONFIRMED"  # Mark that name entry is done
+                    self.playlist_name_confirmed = True  # Name entry is done
                     self.selected_index = 0
-                    return True  # Need full redraw to show track selection UI
+                    self._mark_dirty('results')
+                    return False
             elif key == 27:  # ESC - cancel
                 self.mode = "main"
                 self.playlist_name = ""
-                self.playlist_selected_tracks = []
+                self.playlist_name_confirmed = False
+                self._set_playlist_selection([])
                 self.status_message = "Playlist creation cancelled"
-                return True
+                self._mark_view_changed()
+                return False
             elif key == curses.KEY_BACKSPACE or key == 127:
                 self.playlist_name = self.playlist_name[:-1]
                 self.update_playlist_name_input()
                 return False  # No full redraw needed
             elif 32 <= key <= 126:  # Printable characters
-                self.playlist_name += chr(key)
+                self.playlist_name += self._read_printable_burst(key)
                 self.update_playlist_name_input()
                 return False  # No full redraw needed
         else:
@@ -1567,7 +1955,8 @@ class MusicPlayerUI:
                         needs_scroll = True
                     
                     if needs_scroll:
-                        return True  # Need full redraw
+                        self._mark_dirty('results')
+                        return False
                     else:
                         self.update_playlist_creation_line(prev_index)
                         self.update_playlist_creation_line(self.selected_index)
@@ -1589,7 +1978,8 @@ class MusicPlayerUI:
                         needs_scroll = True
                     
                     if needs_scroll:
-                        return True  # Need full redraw
+                        self._mark_dirty('results')
+                        return False
                     else:
                         self.update_playlist_creation_line(prev_index)
                         self.update_playlist_creation_line(self.selected_index)
@@ -1598,20 +1988,26 @@ class MusicPlayerUI:
                 if self.selected_index < len(self.player.favorites):
                     fav = self.player.favorites[self.selected_index]
                     # Check if track is already selected
-                    is_selected = any(t.get('id') == fav.get('id') for t in self.playlist_selected_tracks)
-                    if is_selected:
+                    fav_id = fav.get('id')
+                    if fav_id in self._playlist_selected_ids:
                         # Remove from selection
-                        self.playlist_selected_tracks = [t for t in self.playlist_selected_tracks if t.get('id') != fav.get('id')]
+                        self.playlist_selected_tracks = [t for t in self.playlist_selected_tracks if t.get('id') != fav_id]
+                        self._playlist_tracks_owned = True
+                        self._playlist_selected_ids.discard(fav_id)
                     else:
                         # Add to selection
+                        if not self._playlist_tracks_owned:
+                            # Still the playlist's own list - copy it before the first change
+                            self.playlist_selected_tracks = list(self.playlist_selected_tracks)
+                            self._playlist_tracks_owned = True
                         self.playlist_selected_tracks.append(fav)
+                        self._playlist_selected_ids.add(fav_id)
                     # Only update the current line
                     self.update_playlist_creation_line(self.selected_index)
                     return False  # No full redraw needed
             elif key == 10:  # Enter - create or update playlist
                 if self.playlist_selected_tracks:
-                    # Remove the _CONFIRMED suffix before creating/updating
-                    clean_name = self.playlist_name.replace("_CONFIRMED", "")
+                    clean_name = self.playlist_name
                     
                     if self.mode == "playlist_edit" and self.editing_playlist_id:
                         # Update existing playlist
@@ -1619,17 +2015,19 @@ class MusicPlayerUI:
                         if success:
                             self.status_message = f"Updated playlist: {clean_name}"
                             # Return to playlist view
-                            updated_playlist = next((p for p in self.player.playlists if p.get('id') == self.editing_playlist_id), None)
+                            updated_playlist = self.player.get_playlist(self.editing_playlist_id)
                             if updated_playlist:
                                 self.current_viewing_playlist = updated_playlist
                                 self.mode = "playlist_view"
                             else:
                                 self.mode = "main"
                             self.playlist_name = ""
-                            self.playlist_selected_tracks = []
+                            self.playlist_name_confirmed = False
+                            self._set_playlist_selection([])
                             self.editing_playlist_id = None
                             self.selected_index = 0
-                            return True
+                            self._mark_view_changed()
+                            return False
                     else:
                         # Create new playlist
                         success = self.player.create_playlist(clean_name, self.playlist_selected_tracks)
@@ -1637,20 +2035,19 @@ class MusicPlayerUI:
                             self.status_message = f"Created playlist: {clean_name}"
                             self.mode = "main"
                             self.playlist_name = ""
-                            self.playlist_selected_tracks = []
+                            self.playlist_name_confirmed = False
+                            self._set_playlist_selection([])
                             self.selected_index = 0
-                            return True
+                            self._mark_view_changed()
+                            return False
                 else:
                     self.status_message = "Select at least one track!"
-                    self.update_status()
+                    self._mark_dirty('status')
             elif key == ord('D') or key == ord('d'):  # Delete playlist (only in edit mode)
                 if self.mode == "playlist_edit" and self.editing_playlist_id:
                     # Find the playlist name before deleting
-                    playlist_name = ""
-                    for p in self.player.playlists:
-                        if p.get('id') == self.editing_playlist_id:
-                            playlist_name = p.get('name', 'Unnamed')
-                            break
+                    playlist = self.player.get_playlist(self.editing_playlist_id)
+                    playlist_name = playlist.get('name', 'Unnamed') if playlist else ""
                     
                     # Delete the playlist
                     self.player.delete_playlist(self.editing_playlist_id)
@@ -1660,11 +2057,13 @@ class MusicPlayerUI:
                     self.mode = "main"
                     self.current_viewing_playlist = None
                     self.playlist_name = ""
-                    self.playlist_selected_tracks = []
+                    self.playlist_name_confirmed = False
+                    self._set_playlist_selection([])
                     self.editing_playlist_id = None
                     self.selected_index = 0
                     self.scroll_offset = 0
-                    return True
+                    self._mark_view_changed()
+                    return False
             elif key == 27:  # ESC - cancel
                 if self.mode == "playlist_edit":
                     # Return to playlist view
@@ -1675,9 +2074,11 @@ class MusicPlayerUI:
                     self.mode = "main"
                     self.status_message = "Playlist creation cancelled"
                 self.playlist_name = ""
-                self.playlist_selected_tracks = []
+                self.playlist_name_confirmed = False
+                self._set_playlist_selection([])
                 self.editing_playlist_id = None
-                return True
+                self._mark_view_changed()
+                return False
         
         return False
     
@@ -1693,12 +2094,12 @@ class MusicPlayerUI:
             self.selected_index = max(0, self.selected_index - 1)
             if prev_index != self.selected_index:
                 if self.adjust_viewport():
-                    return True
+                    self._mark_dirty('results')
+                    return False
                 else:
                     # Update only the two affected lines
                     self.update_result_line(prev_index)
                     self.update_result_line(self.selected_index)
-                    self.stdscr.refresh()
             return False
             
         elif key == curses.KEY_DOWN:
@@ -1706,12 +2107,12 @@ class MusicPlayerUI:
             self.selected_index = min(len(tracks) - 1, self.selected_index + 1)
             if prev_index != self.selected_index:
                 if self.adjust_viewport():
-                    return True
+                    self._mark_dirty('results')
+                    return False
                 else:
                     # Update only the two affected lines
                     self.update_result_line(prev_index)
                     self.update_result_line(self.selected_index)
-                    self.stdscr.refresh()
             return False
             
         elif key == 10:  # Enter - play track and set playlist mode
@@ -1720,56 +2121,292 @@ class MusicPlayerUI:
                 
                 # Clear visualizer immediately in main thread
                 self.visualizer.clear_immediately()
-                self.draw_visualizer()  # Redraw to show cleared state
-                self.stdscr.refresh()
+                self._mark_dirty('visualizer')  # Redraw to show cleared state
                 
                 # Play in background thread
+                # Captured now; the selection may move before the worker gets to it
+                playlist_id = self.current_viewing_playlist['id']
+                track_index = self.selected_index
+                
                 def play_playlist_async():
-                    success = self.player.play_playlist_track(
-                        self.current_viewing_playlist['id'],
-                        self.selected_index
-                    )
+                    success = self.player.play_playlist_track(playlist_id, track_index)
                     if success:
-                        self.status_message = f"Playing from playlist: {tracks[self.selected_index]['title'][:50]}"
+                        self.status_message = f"Playing from playlist: {tracks[track_index]['title'][:50]}"
                     else:
                         self.status_message = "Failed to load track"
-                    self.update_status()
+                    self._mark_dirty('status')
                 
-                thread = threading.Thread(target=play_playlist_async)
-                thread.daemon = True
-                thread.start()
-                self.update_status()
+                self._submit_play(play_playlist_async)
+                self._mark_dirty('status')
                 
         elif key == 27:  # ESC - return to main
-            self.mode = "main"
-            self.search_query = ""  # Clear search when returning to main
-            self.current_viewing_playlist = None
-            self.selected_index = 0
-            self.scroll_offset = 0
-            return True
+            self._reset_to_main()
+            return False
             
         elif key == ord('E') or key == ord('e'):  # Edit playlist
             if self.current_viewing_playlist:
                 # Enter edit mode for the current playlist
                 self.mode = "playlist_edit"
-                self.playlist_name = self.current_viewing_playlist['name'] + "_CONFIRMED"  # Skip name entry
-                self.playlist_selected_tracks = list(self.current_viewing_playlist.get('tracks', []))  # Copy current tracks
+                self.playlist_name = self.current_viewing_playlist['name']
+                self.playlist_name_confirmed = True  # Skip name entry
+                # Shared with the playlist until the first change; ESC without edits copies nothing
+                self._set_playlist_selection(self.current_viewing_playlist.get('tracks', []), owned=False)
                 self.editing_playlist_id = self.current_viewing_playlist['id']
                 self.selected_index = 0
                 self.scroll_offset = 0  # Reset scroll position
                 self.status_message = f"Editing playlist: {self.current_viewing_playlist['name']}"
-                return True
+                self._mark_view_changed()
+                return False
                 
         
         return False
     
+    def _mark_dirty(self, *regions):
+        """Flag screen regions for redraw on the next main loop iteration"""
+        for region in regions:
+            self._dirty[region] = True
+        if threading.get_ident() != self._main_thread_id:
+            self._wake()  # The main loop may be asleep waiting for input
+    
+    def _wake(self):
+        """Wake the main loop if it is waiting for input; safe from any thread or signal handler"""
+        try:
+            os.write(self._wake_w, b'\0')
+        except OSError:
+            pass  # Pipe full: a wakeup is already pending
+    
+    def _submit_play(self, fn):
+        """Load a track in the background, dropping an earlier load that hasn't started yet"""
+        if self._play_future is not None:
+            self._play_future.cancel()  # No effect once it is running
+        self._play_future = self._io_worker.submit(fn)
+    
+    def _wake_when_done(self, future):
+        """Have a background future wake the main loop when it completes"""
+        future.add_done_callback(lambda _: self._wake())
+        return future
+    
+    def _wait_for_input(self, timeout):
+        """Sleep until a key arrives, something wakes the loop, or timeout seconds pass"""
+        try:
+            ready, _, _ = select.select([sys.stdin, self._wake_r], [], [], timeout)
+        except (OSError, ValueError):
+            return
+        if self._wake_r in ready:
+            try:
+                while os.read(self._wake_r, 512):
+                    pass
+            except OSError:
+                pass  # Drained
+    
+    def _reset_to_main(self):
+        """Leave the current view for the main page, from the top"""
+        self.mode = "main"
+        self.search_query = ""  # Clear search when returning to main
+        self._drop_load_more()  # Its results would land on the main page
+        self.current_viewing_playlist = None
+        self.selected_index = 0
+        self.scroll_offset = 0
+        self.status_message = self.STATUS_FAVORITES if self.player.favorites else self.STATUS_NO_FAVORITES
+        self._mark_view_changed()
+    
+    def _mark_view_changed(self):
+        """Flag everything that depends on the current mode/view for redraw"""
+        self._mark_dirty('search', 'results', 'controls', 'status')
+    
+    def _redraw_dirty(self):
+        """Redraw the flagged screen regions"""
+        dirty = self._dirty
+        if dirty['search']:
+            dirty['search'] = False
+            self.update_search_bar()
+        if dirty['results']:
+            dirty['results'] = False
+            self.draw_results()
+        if dirty['controls']:
+            dirty['controls'] = False
+            self.draw_controls()
+        if dirty['visualizer']:
+            dirty['visualizer'] = False
+            self.draw_visualizer()
+        if dirty['status']:
+            dirty['status'] = False
+            self.update_status()
+    
+    def finish_search(self):
+        """Apply a completed background search"""
+        results = self._search_future.result()
+        self._search_future = None
+        self.player.search_results = results
+        
+        if results:
+            self.mode = "results"
+            self.selected_index = 0
+            self.prev_selected_index = -1
+            self.scroll_offset = 0  # Reset scroll position
+            self.status_message = f"Showing {len(results)} results (scroll down for more)"
+            self._mark_view_changed()
+        else:
+            self.status_message = "No results found"
+            self._mark_dirty('status')
+    
+    def _drop_load_more(self):
+        """Forget a pending "load more", cancelling it if it hasn't started"""
+        if self._load_more_future is not None:
+            self._load_more_future.cancel()
+            self._load_more_future = None
+        self.is_loading_more = False
+    
+    def finish_load_more(self):
+        """Apply completed "load more" results"""
+        new_results = self._load_more_future.result()
+        self._load_more_future = None
+        self.is_loading_more = False
+        if new_results:
+            old_len = len(self.player.search_results)
+            self.player.search_results.extend(new_results)
+            self.status_message = f"Showing {len(self.player.search_results)} results"
+            if self.mode in ("results", "search"):  # The views that show search results
+                # Rows above the new ones are unchanged; this only draws those that are in view
+                for index in range(old_len, len(self.player.search_results)):
+                    self.update_result_line(index)
+        else:
+            self.status_message = f"Showing all {len(self.player.search_results)} results found"
+        self._mark_dirty('status')
+    
+    def _schedule(self, delay, callback):
+        """Run callback from the main loop after delay seconds"""
+        heapq.heappush(self._timers, (time.monotonic() + delay, next(self._timer_seq), callback))
+        self._scheduled.add(callback)
+    
+    def _run_due_timers(self):
+        """Run the timer callbacks whose deadline has passed"""
+        timers = self._timers
+        now = time.monotonic()
+        while timers and timers[0][0] <= now:
+            _, _, callback = heapq.heappop(timers)
+            self._scheduled.discard(callback)
+            callback()
+    
+    def _next_timeout(self):
+        """Seconds the main loop may sleep before the next timer is due"""
+        if not self._timers:
+            return None
+        return max(0.0, self._timers[0][0] - time.monotonic())
+    
+    def _start_playback_timers(self):
+        """Schedule the animation timers that are only needed while something plays"""
+        for callback in (self._tick_visualizer, self._tick_progress, self._tick_title):
+            if callback not in self._scheduled:
+                self._schedule(0, callback)
+    
+    def _tick_visualizer(self):
+        """Advance the visualizer at 20 FPS while its bars move"""
+        visualizer = self.visualizer
+        if self.player.is_playing:
+            was_moving = visualizer.is_fading
+            visualizer.update_from_vlc(self.player.player)
+            if visualizer.is_fading or was_moving:
+                self._mark_dirty('visualizer')
+                self._schedule(0.05, self._tick_visualizer)
+            else:
+                # Paused with the bars already down: nothing changes before libvlc is polled again
+                self._schedule(visualizer.VLC_POLL_INTERVAL, self._tick_visualizer)
+        elif visualizer.is_fading:
+            visualizer.update_from_vlc(None)  # Drops the bars at once
+            self._mark_dirty('visualizer')  # Draw the final, empty frame
+        # Otherwise settled: stop until playback starts again
+    
+    def _tick_progress(self):
+        """Redraw the progress bar once a second while playing"""
+        if self.player.is_playing:
+            self._mark_dirty('status')
+            self._schedule(1, self._tick_progress)
+    
+    def _tick_title(self):
+        """Scroll a long track title while playing"""
+        if self.player.is_playing and self.player.current_track:
+            self.title_scroll_offset += 1
+            self._mark_dirty('status')
+            self._schedule(0.15, self._tick_title)
+    
+    def _tick_playback(self):
+        """Check for playlist auto-play every 2 seconds"""
+        self.player.check_playback_status()
+        self._schedule(2, self._tick_playback)
+    
+    def _show_volume(self):
+        """Show the volume in the status line for 3 seconds"""
+        self.volume_display_until = time.monotonic() + 3
+        self._mark_dirty('status')
+        self._schedule(3, lambda: self._mark_dirty('status'))  # Take it down again
+    
+    def handle_key(self, key):
+        """Dispatch one key press to the handler for the current mode; False means quit"""
+        try:
+            if self.mode == "search":
+                # In search mode, handle ALL input through search handler
+                self.handle_search_input(key)
+
+            elif self.mode == "playlist_create" and not self.playlist_name_confirmed:
+                # In playlist name entry mode, handle ALL input through playlist handler
+                self.handle_playlist_creation_input(key)
+
+            elif key == ord('q'):
+                self.player.stop()
+                return False
+
+            elif key == ord('/'):
+                self.mode = "search"
+                self.search_query = ""
+                self._mark_dirty('search')
+
+            elif key == ord('s'):
+                self.player.stop()
+                self.status_message = "Playback stopped"
+                self._mark_dirty('status')
+
+            elif key == ord(' '):  # Spacebar - pause/resume (except in playlist track selection)
+                # Don't handle space here if we're in playlist track selection mode
+                if (self.mode == "playlist_create" and self.playlist_name_confirmed) or self.mode == "playlist_edit":
+                    # Let the playlist handler deal with it
+                    self.handle_playlist_creation_input(key)
+                else:
+                    self.player.toggle_pause()
+
+            elif key == ord('+') or key == ord('='):  # Volume up
+                self.player.volume_up()
+                self._show_volume()
+
+            elif key == ord('-') or key == ord('_'):  # Volume down
+                self.player.volume_down()
+                self._show_volume()
+
+            elif key == 27 and self.mode != "search":  # ESC - return to main (when not in search mode)
+                self._reset_to_main()
+
+            elif self.mode == "results":
+                self.handle_results_input(key)
+
+            elif self.mode == "main":
+                self.handle_main_input(key)
+
+            elif (self.mode == "playlist_create" and self.playlist_name_confirmed) or self.mode == "playlist_edit":
+                # Track selection mode - handle input
+                self.handle_playlist_creation_input(key)
+
+            elif self.mode == "playlist_view":
+                self.handle_playlist_view_input(key)
+
+        except curses.error:
+            pass  # A handler drew past the edge of a very small terminal; the next redraw fixes it
+        return True
+    
     def run(self):
         """Main UI loop"""
-        self.stdscr.timeout(50)  # 50ms timeout for fast visualizer updates
+        self.stdscr.timeout(0)  # Never block in getch(); waiting is done in _wait_for_input
         needs_full_redraw = True
-        last_progress_update = 0
-        last_playback_check = 0
-        last_visualizer_update = 0
+        self._schedule(0, self._tick_playback)
         
         while True:
             # Check for terminal resize
@@ -1781,7 +2418,9 @@ class MusicPlayerUI:
                     # Update our dimensions
                     self.update_dimensions()
                     
-                    # Force a complete redraw
+                    # Force a complete redraw; the terminal may have reflowed what it showed,
+                    # so repaint every cell instead of diffing against the old screen
+                    self.stdscr.clearok(True)
                     needs_full_redraw = True
                     self.resize_detected = False
                     
@@ -1790,123 +2429,73 @@ class MusicPlayerUI:
                     needs_full_redraw = True
                     self.resize_detected = False
             
+            # Pick up background searches that have finished
+            if self._search_future and self._search_future.done():
+                self.finish_search()
+            if self._load_more_future and self._load_more_future.done():
+                self.finish_load_more()
+            
             # Only do full redraw when absolutely needed
             if needs_full_redraw:
-                self.stdscr.clear()
+                self.stdscr.erase()  # Blank the virtual screen only; doupdate() sends just what differs
+                self._row_cache.clear()
+                self._last_bars = None
+                self._status_shown = None
+                self._vis_rows = None
                 self.draw_static_ui()
                 self.update_search_bar()
                 self.draw_results()  # This now handles both favorites and search results
                 self.draw_visualizer()  # Draw audio visualizer
                 self.update_status()
                 needs_full_redraw = False
+                for region in self._dirty:
+                    self._dirty[region] = False  # Everything was just drawn
             
-            # Update progress bar and title scrolling periodically
-            current_time = time.time()
-            should_update_status = False
-            
-            if self.player.is_playing and current_time - last_progress_update >= 1:
-                should_update_status = True
-                last_progress_update = current_time
+            # Playback may have started since the last iteration (keys, worker threads)
+            if self.player.is_playing:
+                self._start_playback_timers()
             
-            # Update title scrolling for long titles
-            if self.player.is_playing and self.player.current_track and self.update_title_scroll():
-                should_update_status = True
+            # Visualizer, progress, title scrolling and playback checks that are due
+            self._run_due_timers()
             
-            # Update visualizer at high frequency (20 FPS)
-            if current_time - last_visualizer_update >= 0.05:  # 50ms = 20 FPS
-                if self.player.is_playing:
-                    self.visualizer.update_from_vlc(self.player.player)
-                    self.draw_visualizer()
-                else:
-                    self.visualizer.update_from_vlc(None)
-                    if any(level > 0.01 for level in self.visualizer.frequency_bands):  # Only redraw if still fading
-                        self.draw_visualizer()
-                last_visualizer_update = current_time
-            
-            if should_update_status:
-                self.update_status()
+            # Redraw only the regions something changed in
+            self._redraw_dirty()
             
-            # Check for playlist auto-play every 2 seconds
-            if current_time - last_playback_check >= 2:
-                self.player.check_playback_status()
-                last_playback_check = current_time
+            # Flush everything drawn this iteration to the terminal in one go
+            self.stdscr.noutrefresh()
+            self._refresh_list_pad()  # After stdscr, so the list sits on top of it
+            curses.doupdate()
             
-            # Handle input (with timeout for progress updates)
+            # Handle input; curses may already hold keys it read ahead, so ask it first
             try:
                 key = self.stdscr.getch()
-                
-                # If timeout (no key pressed), continue to next iteration
                 if key == -1:
-                    continue
-                
-                # Handle terminal resize
-                if key == curses.KEY_RESIZE:
-                    self.resize_detected = True
-                    continue
-                
-                if self.mode == "search":
-                    # In search mode, handle ALL input through search handler
-                    needs_full_redraw = self.handle_search_input(key)
-                    
-                elif self.mode == "playlist_create" and not self.playlist_name.endswith("_CONFIRMED"):
-                    # In playlist name entry mode, handle ALL input through playlist handler
-                    needs_full_redraw = self.handle_playlist_creation_input(key)
-                    
-                elif key == ord('q'):
-                    self.player.stop()
+                    # Nothing pending: sleep until input, a wakeup, or the next timer is due
+                    self._wait_for_input(self._next_timeout())
+                    key = self.stdscr.getch()
+            except curses.error:
+                continue
+            
+            # If timeout (no key pressed), continue to next iteration
+            if key == -1:
+                continue
+            
+            # Handle terminal resize
+            if key == curses.KEY_RESIZE:
+                self.resize_detected = True
+                continue
+            
+            if not self.handle_key(key):
+                break
+            
+            # A held arrow key queues repeats faster than frames are drawn: apply the whole run, draw once
+            while key in (curses.KEY_UP, curses.KEY_DOWN):
+                key = self.stdscr.getch()
+                if key not in (curses.KEY_UP, curses.KEY_DOWN):
+                    if key != -1:
+                        curses.ungetch(key)  # Handled on the next iteration, after drawing
                     break
-                    
-                elif key == ord('/'):
-                    self.mode = "search"
-                    self.search_query = ""
-                    self.update_search_bar()
-                    
-                elif key == ord('s'):
-                    self.player.stop()
-                    self.status_message = "Playback stopped"
-                    self.update_status()
-                    
-                elif key == ord(' '):  # Spacebar - pause/resume (except in playlist track selection)
-                    # Don't handle space here if we're in playlist track selection mode
-                    if (self.mode == "playlist_create" and self.playlist_name.endswith("_CONFIRMED")) or self.mode == "playlist_edit":
-                        # Let the playlist handler deal with it
-                        needs_full_redraw = self.handle_playlist_creation_input(key)
-                    else:
-                        self.player.toggle_pause()
-                    
-                elif key == ord('+') or key == ord('='):  # Volume up
-                    self.player.volume_up()
-                    self.volume_display_until = time.time() + 3  # Show for 3 seconds
-                    self.update_status()
-                    
-                elif key == ord('-') or key == ord('_'):  # Volume down
-                    self.player.volume_down()
-                    self.volume_display_until = time.time() + 3  # Show for 3 seconds
-                    self.update_status()
-                    
-                elif key == 27 and self.mode != "search":  # ESC - return to main (when not in search mode)
-                    self.mode = "main"
-                    self.search_query = ""  # Clear search when returning to main
-                    self.selected_index = 0 if self.player.favorites else 0
-                    self.scroll_offset = 0
-                    self.status_message = "★ Favorites" if self.player.favorites else "No favorites yet"
-                    needs_full_redraw = True
-                    
-                elif self.mode == "results":
-                    needs_full_redraw = self.handle_results_input(key)
-                    
-                elif self.mode == "main":
-                    needs_full_redraw = self.handle_main_input(key)
-                    
-                elif (self.mode == "playlist_create" and self.playlist_name.endswith("_CONFIRMED")) or self.mode == "playlist_edit":
-                    # Track selection mode - handle input
-                    needs_full_redraw = self.handle_playlist_creation_input(key)
-                    
-                elif self.mode == "playlist_view":
-                    needs_full_redraw = self.handle_playlist_view_input(key)
-                    
-            except:
-                pass
+                self.handle_key(key)
 
 def main(stdscr):
     ui = MusicPlayerUI(stdscr)